@@ -0,0 +1,66 @@
+"""
+Shared resources for the test scripts
+Keeps one Postgres connection pool per database URL, one SentimentAnalyzer per
+API configuration and one price download per ticker set, so scripts run together
+in one process reuse them
+"""
+
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
+from psycopg2.pool import ThreadedConnectionPool
+
+# Tickers whose price history is downloaded once and shared by the tests
+OHLCV_TICKERS = ("AAPL", "TSLA", "MSFT", "GOOGL", "AMZN")
+
+# Environment variables that change how a SentimentAnalyzer is configured
+ANALYZER_ENV_VARS = (
+    "XAI_API_KEY", "XAI_API_URL", "XAI_MODEL",
+    "REDDIT_CLIENT_ID", "REDDIT_CLIENT_SECRET", "REDDIT_USER_AGENT", "user_agent"
+)
+
+def secret(name: str) -> Optional[str]:
+    """Read a credential from the environment, falling back to a local .env file"""
+    return os.environ.get(name) or _dotenv().get(name)
+
+@lru_cache(maxsize=1)
+def _dotenv() -> Mapping[str, Optional[str]]:
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        return {}
+    return dotenv_values()
+
+@lru_cache(maxsize=None)
+def get_pool(database_url: str) -> ThreadedConnectionPool:
+    """Connection pool for a database URL, created on first use"""
+    return ThreadedConnectionPool(1, 4, database_url)
+
+@contextmanager
+def pooled_connection(database_url: str):
+    """Borrow a connection from the pool and always hand it back"""
+    pool = get_pool(database_url)
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
+
+def get_analyzer(creds: Optional[Mapping[str, str]] = None):
+    """SentimentAnalyzer for the given credentials (default: the environment), created once per configuration"""
+    source = os.environ if creds is None else creds
+    return _analyzer_for(tuple(source.get(name) for name in ANALYZER_ENV_VARS))
+
+@lru_cache(maxsize=4)
+def _analyzer_for(env_fingerprint: tuple):
+    from modules.sentiment_analyzer import SentimentAnalyzer
+    creds = {name: value for name, value in zip(ANALYZER_ENV_VARS, env_fingerprint) if value is not None}
+    return SentimentAnalyzer(creds=MappingProxyType(creds))
+
+@lru_cache(maxsize=4)
+def get_ohlcv(tickers: tuple = OHLCV_TICKERS, period: str = "6mo"):
+    """Price history for all tickers in one batched yfinance download, grouped by ticker"""
+    import yfinance as yf
+    return yf.download(list(tickers), period=period, group_by="ticker", threads=True, progress=False, auto_adjust=True)
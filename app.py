@@ -361,17 +361,16 @@ def main():
             if not display_df.empty:
                 # Display interactive table with horizontal scrolling
                 st.dataframe(
-                    display_df,
+                    DataFormatter.style_results_for_display(display_df),
                     width=1200,  # Fixed width to force horizontal scrolling
                     height=400,
                     hide_index=True,
                     column_config={
                         "Ticker": st.column_config.TextColumn("Ticker", width=80),
-                        "Current Price": st.column_config.TextColumn("Current Price", width=100),
+                        "Current Price": st.column_config.NumberColumn("Current Price", width=100),
                         "Final Score": st.column_config.NumberColumn(
                             "Final Score",
                             help="Weighted score (-1 to +1)",
-                            format="%.4f",
                             width=100
                         ),
                         "Signal": st.column_config.TextColumn(
@@ -0,0 +1,38 @@
+"""
+Shared pytest fixtures
+Analyzers and price data are built once per test session, so the Reddit handshake,
+module imports and price downloads are paid once rather than once per test
+"""
+
+import sys
+from pathlib import Path
+from types import MappingProxyType
+import pytest
+
+# Make the repository root importable once per session (modules package and _pool)
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _pool import get_analyzer, get_ohlcv, secret
+
+# Reddit credentials from the environment or a local .env file, read once and passed
+# straight to the analyzer; the user agent matches the one set in Railway
+REDDIT_CREDS = MappingProxyType({
+    "REDDIT_CLIENT_ID": secret("REDDIT_CLIENT_ID") or "",
+    "REDDIT_CLIENT_SECRET": secret("REDDIT_CLIENT_SECRET") or "",
+    "user_agent": "StockResearchBot/1.0",
+})
+
+@pytest.fixture(scope="session")
+def analyzer():
+    """SentimentAnalyzer configured from the environment"""
+    return get_analyzer()
+
+@pytest.fixture(scope="session")
+def reddit_analyzer():
+    """SentimentAnalyzer configured with the Reddit credentials"""
+    return get_analyzer(REDDIT_CREDS)
+
+@pytest.fixture(scope="session")
+def ohlcv():
+    """Six months of prices for the shared test tickers, one column group per ticker"""
+    return get_ohlcv()
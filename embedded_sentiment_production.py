@@ -6,6 +6,7 @@ Focuses on real API configuration and troubleshooting guidance
 import streamlit as st
 import pandas as pd
 from datetime import datetime
+from modules.utils import DataFormatter
 
 def show_embedded_sentiment_analysis():
     """Show embedded sentiment analysis with production focus and troubleshooting"""
@@ -38,7 +39,7 @@ def show_embedded_sentiment_analysis():
                 if not valid_results.empty and 'ticker' in valid_results.columns:
                     try:
                         # Get top tickers safely
-                        top_tickers = valid_results.nlargest(10, 'final_weighted_score')['ticker'].tolist()
+                        top_tickers = DataFormatter.top_n(valid_results, 10)['ticker'].tolist()
                         
                         st.info(f"""
                         **Ready for Social Media Sentiment Analysis!**
@@ -163,7 +164,7 @@ def show_embedded_sentiment_analysis():
                                                 if 'signal' in valid_results.columns:
                                                     kpi_columns.append('signal')
                                                 
-                                                kpi_top = valid_results.nlargest(10, 'final_weighted_score')[kpi_columns]
+                                                kpi_top = DataFormatter.top_n(valid_results, 10)[kpi_columns]
                                                 combined = pd.merge(kpi_top, formatted_results, left_on='ticker', right_on='Ticker', how='left')
                                                 
                                                 combined_csv = combined.to_csv(index=False)
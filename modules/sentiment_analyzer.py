@@ -4,43 +4,163 @@ Focuses on real API configuration and troubleshooting instead of demo mode
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import praw
 from datetime import datetime, timezone, timedelta
 import os
 import pandas as pd
+import numpy as np
 import streamlit as st
-from typing import List, Dict, Optional
+from typing import List, Dict, Mapping, Optional, Tuple
 import time
 import json
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# Parse and encode API JSON with orjson when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+
+# Tickers scored per Grok request
+_X_BATCH_SIZE = 20
+
+# Upper bound on concurrent sentiment fetches
+_MAX_WORKERS = 32
+
+# StockTwits' public API is rate limited per client, so at most this many of its
+# requests are in flight at once whatever the worker count
+_STOCKTWITS_CONCURRENCY = 4
+_STOCKTWITS_SLOTS = threading.BoundedSemaphore(_STOCKTWITS_CONCURRENCY)
+
+# Longest wait honoured from a Retry-After header before retrying
+_RETRY_AFTER_MAX_SECONDS = 10
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After headers, but never sleeps longer than _RETRY_AFTER_MAX_SECONDS"""
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, _RETRY_AFTER_MAX_SECONDS)
+
+
+# Shared session so concurrent fetches reuse pooled keep-alive connections; transient
+# failures are retried with backoff and the final response is left to the callers' handling
+_HTTP_RETRY = _CappedRetry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({'GET', 'POST'}),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+_HTTP_SESSION = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=_MAX_WORKERS, pool_maxsize=_MAX_WORKERS, max_retries=_HTTP_RETRY)
+_HTTP_SESSION.mount("https://", _HTTP_ADAPTER)
+_HTTP_SESSION.mount("http://", _HTTP_ADAPTER)
+
+# JSON array in a model reply, with or without a surrounding code fence
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+# Sentiment scores are cached per (analyzer config, source, ticker, hour bucket, hours_back)
+# for the current hour; the oldest entries are evicted beyond _SENTIMENT_CACHE_MAX_ENTRIES
+_CACHE_TTL_SECONDS = 3600
+_SENTIMENT_CACHE_MAX_ENTRIES = 4096
+_SENTIMENT_CACHE: "OrderedDict[Tuple[Tuple[str, ...], str, str, int, int], int]" = OrderedDict()
+_SENTIMENT_CACHE_LOCK = threading.Lock()
+
+
+def _prune_sentiment_cache(bucket: int):
+    """Drop entries from earlier hour buckets (caller holds _SENTIMENT_CACHE_LOCK)"""
+    for key in [key for key in _SENTIMENT_CACHE if key[3] != bucket]:
+        del _SENTIMENT_CACHE[key]
+
+
+def _cached_sentiment(scope: Tuple[str, ...], tickers, bucket: int, hours_back: int) -> Dict[str, Dict[str, int]]:
+    """Look up cached scores per source for one analyzer configuration"""
+    with _SENTIMENT_CACHE_LOCK:
+        _prune_sentiment_cache(bucket)
+        
+        scores = {'X': {}, 'Reddit': {}, 'StockTwits': {}}
+        for source, source_scores in scores.items():
+            for ticker in tickers:
+                key = (scope, source, ticker, bucket, hours_back)
+                if key in _SENTIMENT_CACHE:
+                    source_scores[ticker] = _SENTIMENT_CACHE[key]
+        return scores
+
+
+def _store_sentiment(scope: Tuple[str, ...], scores: Dict[str, Dict[str, int]], bucket: int, hours_back: int):
+    """Cache freshly fetched scores for the rest of the hour bucket"""
+    with _SENTIMENT_CACHE_LOCK:
+        _prune_sentiment_cache(bucket)
+        for source, source_scores in scores.items():
+            for ticker, score in source_scores.items():
+                # The Reddit and StockTwits fetchers also return 0 on failure, so only
+                # non-zero scores from them are trusted enough to cache
+                if source == 'X' or score != 0:
+                    _SENTIMENT_CACHE[(scope, source, ticker, bucket, hours_back)] = score
+        while len(_SENTIMENT_CACHE) > _SENTIMENT_CACHE_MAX_ENTRIES:
+            _SENTIMENT_CACHE.popitem(last=False)
 
 
 class SentimentAnalyzer:
     """Production sentiment analyzer with troubleshooting guidance"""
     
-    def __init__(self):
-        """Initialize the sentiment analyzer with API configurations"""
+    def __init__(self, creds: Optional[Mapping[str, str]] = None, base_url: Optional[str] = None):
+        """Initialize the sentiment analyzer with API configurations
+        
+        Credentials are read from creds when given, otherwise from the environment.
+        base_url overrides the configured X API endpoint.
+        """
+        self.creds = os.environ if creds is None else creds
         self.setup_apis()
+        if base_url:
+            self.xai_api_url = base_url
         self.api_status = self.get_api_status()
+        
+        # Cached scores are only shared between analyzers with the same endpoints and
+        # credentials; the X key is hashed so it is not kept in the cache keys
+        self.cache_scope = (
+            self.xai_api_url,
+            self.xai_model,
+            hashlib.sha256((self.xai_api_key or "").encode("utf-8")).hexdigest(),
+            self.creds.get("REDDIT_CLIENT_ID") or "",
+            self.stocktwits_base_url
+        )
     
     def setup_apis(self):
         """Setup API connections for X, Reddit, and StockTwits"""
         try:
             # X (Twitter) API configuration - Updated with correct endpoint
-            self.xai_api_key = os.getenv("XAI_API_KEY")
-            self.xai_api_url = os.getenv("XAI_API_URL", "https://api.x.ai/v1/messages")
-            self.xai_model = os.getenv("XAI_MODEL", "grok-3")
+            self.xai_api_key = self.creds.get("XAI_API_KEY")
+            self.xai_api_url = self.creds.get("XAI_API_URL", "https://api.x.ai/v1/messages")
+            self.xai_model = self.creds.get("XAI_MODEL", "grok-3")
             
             # Reddit API setup
             self.reddit = None
-            reddit_client_id = os.getenv("REDDIT_CLIENT_ID")
-            reddit_client_secret = os.getenv("REDDIT_CLIENT_SECRET")
+            reddit_client_id = self.creds.get("REDDIT_CLIENT_ID")
+            reddit_client_secret = self.creds.get("REDDIT_CLIENT_SECRET")
             
             if reddit_client_id and reddit_client_secret:
                 try:
                     # Handle multiple possible user agent environment variable names
                     user_agent = (
-                        os.getenv("REDDIT_USER_AGENT") or 
-                        os.getenv("user_agent") or 
+                        self.creds.get("REDDIT_USER_AGENT") or 
+                        self.creds.get("user_agent") or 
                         "StockResearchBot/1.0"
                     )
                     
@@ -128,35 +248,64 @@ Reddit API 401 Error - Authentication Failed:
         # Show which APIs are working
         st.success(f"🚀 **Using APIs**: {', '.join(working_apis)}")
         
-        results = []
-        
         # Calculate time range
         end_time = datetime.now(timezone.utc)
         start_time = end_time - timedelta(hours=hours_back)
         
-        for ticker in tickers:
-            st.write(f"Analyzing sentiment for {ticker}...")
-            
-            # Get sentiment from each platform
-            x_sentiment = self._get_x_sentiment(ticker, start_time, end_time)
-            reddit_sentiment = self._get_reddit_sentiment(ticker, start_time, end_time)
-            stocktwits_sentiment = self._get_stocktwits_sentiment(ticker, start_time, end_time)
-            
-            # Calculate total sentiment
-            total_sentiment = x_sentiment + reddit_sentiment + stocktwits_sentiment
-            
-            results.append({
-                'Ticker': ticker,
-                'X': x_sentiment,
-                'Reddit': reddit_sentiment,
-                'StockTwits': stocktwits_sentiment,
-                'SentimentTotal': total_sentiment
-            })
-            
-            # Small delay between tickers to avoid rate limiting
-            time.sleep(0.5)
+        st.write(f"Analyzing sentiment for {len(tickers)} tickers...")
+        
+        # Scores fetched earlier in the same hour are reused; only misses hit the APIs
+        bucket = int(end_time.timestamp() // _CACHE_TTL_SECONDS)
+        scores = _cached_sentiment(self.cache_scope, dict.fromkeys(tickers), bucket, hours_back)
+        missing = {
+            source: [ticker for ticker in dict.fromkeys(tickers) if ticker not in source_scores]
+            for source, source_scores in scores.items()
+        }
+        
+        # Every fetch is independent and network bound, so run them concurrently;
+        # workers share the script context so their st.warning calls still render.
+        # A praw.Reddit instance is not thread-safe, so all Reddit searches run one
+        # after another in a single worker that overlaps with the other sources
+        max_workers = min(_MAX_WORKERS, len(tickers) + 2)
+        with ThreadPoolExecutor(max_workers=max_workers, initializer=add_script_run_ctx,
+                                initargs=(None, get_script_run_ctx())) as executor:
+            # Score X sentiment for up to _X_BATCH_SIZE tickers per Grok request
+            x_futures = [
+                executor.submit(self._get_x_sentiment_batch, missing['X'][start:start + _X_BATCH_SIZE], start_time, end_time)
+                for start in range(0, len(missing['X']), _X_BATCH_SIZE)
+            ]
+            reddit_future = executor.submit(
+                lambda: {ticker: self._get_reddit_sentiment(ticker, start_time, end_time) for ticker in missing['Reddit']}
+            )
+            stocktwits_futures = {
+                ticker: executor.submit(self._get_stocktwits_sentiment, ticker, start_time, end_time)
+                for ticker in missing['StockTwits']
+            }
+            
+            fetched = {
+                'X': {},
+                'Reddit': reddit_future.result(),
+                'StockTwits': {ticker: future.result() for ticker, future in stocktwits_futures.items()}
+            }
+            for future in x_futures:
+                fetched['X'].update(future.result())
+        
+        _store_sentiment(self.cache_scope, fetched, bucket, hours_back)
+        for source, source_scores in fetched.items():
+            scores[source].update(source_scores)
+        
+        # Build the result columns directly; the total is one vectorized add
+        x_sentiment = np.fromiter((scores['X'].get(ticker, 0) for ticker in tickers), dtype=np.int64, count=len(tickers))
+        reddit_sentiment = np.fromiter((scores['Reddit'].get(ticker, 0) for ticker in tickers), dtype=np.int64, count=len(tickers))
+        stocktwits_sentiment = np.fromiter((scores['StockTwits'].get(ticker, 0) for ticker in tickers), dtype=np.int64, count=len(tickers))
         
-        return pd.DataFrame(results)
+        return pd.DataFrame({
+            'Ticker': tickers,
+            'X': x_sentiment,
+            'Reddit': reddit_sentiment,
+            'StockTwits': stocktwits_sentiment,
+            'SentimentTotal': x_sentiment + reddit_sentiment + stocktwits_sentiment
+        })
     
     def _show_api_setup_guidance(self):
         """Show comprehensive API setup guidance"""
@@ -232,19 +381,29 @@ Reddit API 401 Error - Authentication Failed:
     
     def _get_x_sentiment(self, ticker: str, start_time: datetime, end_time: datetime) -> int:
         """Get sentiment from X (Twitter) using Grok API"""
+        return self._get_x_sentiment_batch([ticker], start_time, end_time).get(ticker, 0)
+    
+    def _get_x_sentiment_batch(self, tickers: List[str], start_time: datetime, end_time: datetime) -> Dict[str, int]:
+        """Get X (Twitter) sentiment for several tickers with a single Grok API request"""
+        label = ", ".join(tickers)
         try:
             if not self.xai_api_key:
-                print(f"⚠️  X API key not configured for {ticker}")
-                return 0
+                print(f"⚠️  X API key not configured for {label}")
+                return {}
             
             # Debug: Show current API configuration
-            print(f"🔍 X API Config for {ticker}:")
+            print(f"🔍 X API Config for {label}:")
             print(f"   API Key: {self.xai_api_key[:10]}...{self.xai_api_key[-4:] if len(self.xai_api_key) > 14 else 'SHORT_KEY'}")
             print(f"   API URL: {self.xai_api_url}")
             print(f"   Model: {self.xai_model}")
             
-            # Updated prompt for better sentiment analysis
-            prompt = f"Analyze recent X (Twitter) posts about ${ticker} stock. Count positive vs negative sentiment mentions in the last 24 hours. Return only numbers in format: 'positive: X, negative: Y'"
+            # One prompt covers every ticker and asks for a JSON array back
+            symbols = ", ".join(f"${ticker}" for ticker in tickers)
+            prompt = (
+                f"Analyze recent X (Twitter) posts about each of these stocks: {symbols}. "
+                "Count positive vs negative sentiment mentions in the last 24 hours for each one. "
+                'Return only a JSON array in format: [{"ticker": "AAPL", "positive": X, "negative": Y}]'
+            )
             
             # Use the correct X API format
             messages = [{"role": "user", "content": prompt}]
@@ -257,17 +416,17 @@ Reddit API 401 Error - Authentication Failed:
             payload = {
                 "model": self.xai_model,
                 "messages": messages,
-                "max_tokens": 100,
+                "max_tokens": 100 * len(tickers),
                 "temperature": 0.3
             }
             
-            print(f"🚀 Making X API request for {ticker}...")
-            response = requests.post(self.xai_api_url, headers=headers, json=payload, timeout=30)
+            print(f"🚀 Making X API request for {label}...")
+            response = _HTTP_SESSION.post(self.xai_api_url, headers=headers, data=_json_dumps(payload), timeout=30)
             
             # Enhanced error handling
             if response.status_code == 404:
                 error_msg = f"""
-❌ X API 404 Error for {ticker}:
+❌ X API 404 Error for {label}:
 
 🔍 DIAGNOSIS:
 - API Endpoint: {self.xai_api_url}
@@ -307,28 +466,28 @@ Set XAI_API_URL to the correct Grok API endpoint in Railway variables.
                 """
                 print(error_msg)
                 if hasattr(st, 'error'):
-                    st.error(f"X API 404 Error for {ticker}")
+                    st.error(f"X API 404 Error for {label}")
                     st.info("Check console/logs for detailed troubleshooting steps")
-                return 0
+                return {}
             
             elif response.status_code == 401:
-                print(f"❌ X API 401 Unauthorized for {ticker}: Invalid API key")
+                print(f"❌ X API 401 Unauthorized for {label}: Invalid API key")
                 if hasattr(st, 'error'):
-                    st.error(f"X API Authentication Failed for {ticker}")
+                    st.error(f"X API Authentication Failed for {label}")
                     st.info("Check XAI_API_KEY in Railway environment variables")
-                return 0
+                return {}
             
             elif response.status_code == 403:
-                print(f"❌ X API 403 Forbidden for {ticker}: Access denied or rate limited")
+                print(f"❌ X API 403 Forbidden for {label}: Access denied or rate limited")
                 if hasattr(st, 'warning'):
-                    st.warning(f"X API Access Denied for {ticker}")
-                return 0
+                    st.warning(f"X API Access Denied for {label}")
+                return {}
             
             # Raise for other HTTP errors
             response.raise_for_status()
             
             # Parse successful response using correct X API format
-            data = response.json()
+            data = _json_loads(response.content)
             
             # Handle the correct X API response structure
             if "content" in data and len(data["content"]) > 0:
@@ -337,47 +496,77 @@ Set XAI_API_URL to the correct Grok API endpoint in Railway variables.
                 # Fallback for OpenAI-style response
                 content = data["choices"][0]["message"]["content"].lower()
             else:
-                print(f"⚠️  Unexpected X API response format for {ticker}: {data}")
-                return 0
+                print(f"⚠️  Unexpected X API response format for {label}: {data}")
+                return {}
             
-            print(f"✅ X API response for {ticker}: {content[:100]}...")
+            print(f"✅ X API response for {label}: {content[:100]}...")
             
-            # Parse response for sentiment counts
-            positive = 0
-            negative = 0
-            
-            try:
-                if "positive:" in content:
-                    positive = int(content.split("positive:")[1].split(",")[0].strip())
-                if "negative:" in content:
-                    negative = int(content.split("negative:")[1].split(",")[0].strip())
-            except:
-                # Enhanced fallback parsing with regex
-                import re
-                pos_match = re.search(r'positive[:\s]+(\d+)', content)
-                neg_match = re.search(r'negative[:\s]+(\d+)', content)
-                if pos_match:
-                    positive = int(pos_match.group(1))
-                if neg_match:
-                    negative = int(neg_match.group(1))
-                
-                # Additional fallback - look for any numbers in context
-                if positive == 0 and negative == 0:
-                    numbers = re.findall(r'\d+', content)
-                    if len(numbers) >= 2:
-                        positive = int(numbers[0])
-                        negative = int(numbers[1])
-            
-            sentiment_score = positive - negative
-            print(f"✅ X sentiment for {ticker}: +{positive} -{negative} = {sentiment_score}")
-            return sentiment_score
+            scores = self._parse_x_batch_response(content, tickers)
+            for ticker, sentiment_score in scores.items():
+                print(f"✅ X sentiment for {ticker}: {sentiment_score}")
+            return scores
             
         except Exception as e:
-            error_details = f"X sentiment analysis failed for {ticker}: {str(e)}"
+            error_details = f"X sentiment analysis failed for {label}: {str(e)}"
             print(f"❌ {error_details}")
             if hasattr(st, 'warning'):
                 st.warning(error_details)
-            return 0
+            return {}
+    
+    @staticmethod
+    def _parse_x_batch_response(content: str, tickers: List[str]) -> Dict[str, int]:
+        """Parse a Grok reply into net sentiment (positive - negative) per requested ticker"""
+        match = _JSON_ARRAY_RE.search(content)
+        if match:
+            try:
+                items = _json_loads(match.group(0))
+                # Replies are lowercased, so map symbols back to the tickers as requested
+                wanted = {ticker.upper(): ticker for ticker in tickers}
+                scores = {}
+                for item in items:
+                    ticker = wanted.get(str(item.get("ticker", "")).lstrip("$").upper())
+                    if ticker is not None:
+                        scores[ticker] = int(item.get("positive", 0)) - int(item.get("negative", 0))
+                return scores
+            except (ValueError, TypeError, AttributeError):
+                pass
+        
+        # A single ticker may still come back as 'positive: X, negative: Y'
+        if len(tickers) == 1:
+            positive, negative = SentimentAnalyzer._parse_x_counts(content)
+            return {tickers[0]: positive - negative}
+        
+        print(f"⚠️  Could not parse X API batch response: {content[:100]}...")
+        return {}
+    
+    @staticmethod
+    def _parse_x_counts(content: str):
+        """Parse 'positive: X, negative: Y' style text into a (positive, negative) pair"""
+        positive = 0
+        negative = 0
+        
+        try:
+            if "positive:" in content:
+                positive = int(content.split("positive:")[1].split(",")[0].strip())
+            if "negative:" in content:
+                negative = int(content.split("negative:")[1].split(",")[0].strip())
+        except:
+            # Enhanced fallback parsing with regex
+            pos_match = re.search(r'positive[:\s]+(\d+)', content)
+            neg_match = re.search(r'negative[:\s]+(\d+)', content)
+            if pos_match:
+                positive = int(pos_match.group(1))
+            if neg_match:
+                negative = int(neg_match.group(1))
+            
+            # Additional fallback - look for any numbers in context
+            if positive == 0 and negative == 0:
+                numbers = re.findall(r'\d+', content)
+                if len(numbers) >= 2:
+                    positive = int(numbers[0])
+                    negative = int(numbers[1])
+        
+        return positive, negative
     
     def _get_reddit_sentiment(self, ticker: str, start_time: datetime, end_time: datetime) -> int:
         """Get sentiment from Reddit"""
@@ -391,80 +580,74 @@ Set XAI_API_URL to the correct Grok API endpoint in Railway variables.
             
             print(f"🔍 Searching Reddit for {ticker} in {len(subreddits)} subreddits...")
             
-            for subreddit_name in subreddits:
+            # Search all subreddits at once through a combined 'a+b+c' subreddit, so each
+            # query is one request instead of one request per subreddit
+            subreddit_name = "+".join(subreddits)
+            subreddit = self.reddit.subreddit(subreddit_name)
+            
+            # Try multiple search strategies
+            search_queries = [
+                f"{ticker}",           # Just ticker
+                f"${ticker}",          # With dollar sign
+                f"{ticker} stock",     # With "stock"
+                f"{ticker.lower()}"    # Lowercase
+            ]
+            
+            for query in search_queries:
                 try:
-                    subreddit = self.reddit.subreddit(subreddit_name)
-                    
-                    # Try multiple search strategies
-                    search_queries = [
-                        f"{ticker}",           # Just ticker
-                        f"${ticker}",          # With dollar sign
-                        f"{ticker} stock",     # With "stock"
-                        f"{ticker.lower()}"    # Lowercase
-                    ]
-                    
-                    for query in search_queries:
-                        try:
-                            # Search recent posts (last week) and sort by new
-                            for submission in subreddit.search(query, sort='new', time_filter='week', limit=10):
-                                created_time = datetime.fromtimestamp(submission.created_utc, tz=timezone.utc)
-                                
-                                # More lenient time filter - check if post is within our timeframe
-                                if created_time >= start_time:
-                                    posts_found += 1
-                                    text = (submission.title + " " + (submission.selftext or "")).lower()
-                                    
-                                    # Enhanced sentiment analysis
-                                    positive_words = [
-                                        "buy", "bullish", "bull", "up", "rise", "rising", "good", "great", 
-                                        "strong", "positive", "moon", "rocket", "calls", "long", "hold",
-                                        "undervalued", "growth", "profit", "gains", "winning", "beat"
-                                    ]
-                                    negative_words = [
-                                        "sell", "bearish", "bear", "down", "fall", "falling", "bad", "weak", 
-                                        "negative", "drop", "crash", "puts", "short", "overvalued", "loss",
-                                        "losing", "miss", "decline", "dump", "avoid"
-                                    ]
-                                    
-                                    # Count sentiment words
-                                    pos_count = sum(1 for word in positive_words if word in text)
-                                    neg_count = sum(1 for word in negative_words if word in text)
-                                    
-                                    # Score the post
-                                    if pos_count > neg_count:
-                                        total_score += 1
-                                    elif neg_count > pos_count:
-                                        total_score -= 1
-                                    
-                                    # Also check comments for popular posts
-                                    if submission.num_comments > 5:
-                                        try:
-                                            submission.comments.replace_more(limit=0)
-                                            for comment in submission.comments[:3]:  # Check top 3 comments
-                                                if hasattr(comment, 'body'):
-                                                    comment_text = comment.body.lower()
-                                                    comment_pos = sum(1 for word in positive_words if word in comment_text)
-                                                    comment_neg = sum(1 for word in negative_words if word in comment_text)
-                                                    
-                                                    if comment_pos > comment_neg:
-                                                        total_score += 1
-                                                    elif comment_neg > comment_pos:
-                                                        total_score -= 1
-                                        except:
-                                            pass
+                    # Search recent posts (last week) and sort by new
+                    for submission in subreddit.search(query, sort='new', time_filter='week', limit=10 * len(subreddits)):
+                        created_time = datetime.fromtimestamp(submission.created_utc, tz=timezone.utc)
+                        
+                        # More lenient time filter - check if post is within our timeframe
+                        if created_time >= start_time:
+                            posts_found += 1
+                            text = (submission.title + " " + (submission.selftext or "")).lower()
+                            
+                            # Enhanced sentiment analysis
+                            positive_words = [
+                                "buy", "bullish", "bull", "up", "rise", "rising", "good", "great", 
+                                "strong", "positive", "moon", "rocket", "calls", "long", "hold",
+                                "undervalued", "growth", "profit", "gains", "winning", "beat"
+                            ]
+                            negative_words = [
+                                "sell", "bearish", "bear", "down", "fall", "falling", "bad", "weak", 
+                                "negative", "drop", "crash", "puts", "short", "overvalued", "loss",
+                                "losing", "miss", "decline", "dump", "avoid"
+                            ]
                             
-                            # Small delay between searches
-                            time.sleep(0.1)
+                            # Count sentiment words
+                            pos_count = sum(1 for word in positive_words if word in text)
+                            neg_count = sum(1 for word in negative_words if word in text)
                             
-                        except Exception as search_e:
-                            print(f"   Search failed for '{query}' in r/{subreddit_name}: {search_e}")
-                            continue
+                            # Score the post
+                            if pos_count > neg_count:
+                                total_score += 1
+                            elif neg_count > pos_count:
+                                total_score -= 1
+                            
+                            # Also check comments for popular posts
+                            if submission.num_comments > 5:
+                                try:
+                                    submission.comments.replace_more(limit=0)
+                                    for comment in submission.comments[:3]:  # Check top 3 comments
+                                        if hasattr(comment, 'body'):
+                                            comment_text = comment.body.lower()
+                                            comment_pos = sum(1 for word in positive_words if word in comment_text)
+                                            comment_neg = sum(1 for word in negative_words if word in comment_text)
+                                            
+                                            if comment_pos > comment_neg:
+                                                total_score += 1
+                                            elif comment_neg > comment_pos:
+                                                total_score -= 1
+                                except:
+                                    pass
                     
-                    # Delay between subreddits
-                    time.sleep(0.3)
+                    # Small delay between searches
+                    time.sleep(0.1)
                     
-                except Exception as sub_e:
-                    print(f"   Subreddit r/{subreddit_name} failed: {sub_e}")
+                except Exception as search_e:
+                    print(f"   Search failed for '{query}' in r/{subreddit_name}: {search_e}")
                     continue
             
             print(f"✅ Reddit search complete for {ticker}: {posts_found} posts found, sentiment score: {total_score}")
@@ -483,10 +666,11 @@ Set XAI_API_URL to the correct Grok API endpoint in Railway variables.
             }
             
             url = f"{self.stocktwits_base_url}/streams/symbol/{ticker}.json"
-            response = requests.get(url, params={"limit": 20}, headers=headers, timeout=10)
+            with _STOCKTWITS_SLOTS:
+                response = _HTTP_SESSION.get(url, params={"limit": 20}, headers=headers, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 messages = data.get("messages", [])
                 
                 score = 0
@@ -532,24 +716,17 @@ Set XAI_API_URL to the correct Grok API endpoint in Railway variables.
         if results_df.empty:
             return results_df
         
-        # Add sentiment interpretation
-        def interpret_sentiment(score):
-            if score >= 5:
-                return "🟢 Very Positive"
-            elif score >= 2:
-                return "🟡 Positive"
-            elif score >= -1:
-                return "⚪ Neutral"
-            elif score >= -3:
-                return "🟠 Negative"
-            else:
-                return "🔴 Very Negative"
-        
-        formatted_df = results_df.copy()
-        formatted_df['Sentiment'] = formatted_df['SentimentTotal'].apply(interpret_sentiment)
+        # Add sentiment interpretation in one vectorized pass over the totals
+        totals = results_df['SentimentTotal'].to_numpy()
+        labels = np.select(
+            [totals >= 5, totals >= 2, totals >= -1, totals >= -3],
+            ["🟢 Very Positive", "🟡 Positive", "⚪ Neutral", "🟠 Negative"],
+            default="🔴 Very Negative"
+        )
         
-        # Reorder columns
-        column_order = ['Ticker', 'X', 'Reddit', 'StockTwits', 'SentimentTotal', 'Sentiment']
-        formatted_df = formatted_df[column_order]
+        # Select the display columns in order (the only copy) and attach the labels
+        column_order = ['Ticker', 'X', 'Reddit', 'StockTwits', 'SentimentTotal']
+        formatted_df = results_df[column_order].copy()
+        formatted_df['Sentiment'] = labels
         
         return formatted_df
@@ -7,11 +7,187 @@ import pandas as pd
 import streamlit as st
 import numpy as np
 import io
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 import re
-import uuid
+import math
+import textwrap
+import secrets
 from datetime import datetime
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill
+from openpyxl.utils import get_column_letter
+from openpyxl.formatting.rule import CellIsRule
 
+# Use pyarrow's multi-threaded CSV parser when it is installed
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+
+# Display column order for analysis results
+_COLUMN_ORDER = (
+    'ticker', 'current_price', 'final_weighted_score', 'signal',
+    'momentum_score', 'trend_score', 'volatility_score',
+    'strength_score', 'support_resistance_score', 'error_message'
+)
+
+# Result columns holding numeric values
+_NUMERIC_COLUMNS = frozenset({
+    'current_price', 'final_weighted_score', 'momentum_score',
+    'trend_score', 'volatility_score', 'strength_score', 'support_resistance_score'
+})
+
+# Display names for result columns
+_COLUMN_NAMES = {
+    'ticker': 'Ticker',
+    'current_price': 'Current Price',
+    'final_weighted_score': 'Final Score',
+    'signal': 'Signal',
+    'momentum_score': 'Momentum',
+    'trend_score': 'Trend',
+    'volatility_score': 'Volatility',
+    'strength_score': 'Strength',
+    'support_resistance_score': 'Support/Resistance',
+    'error_message': 'Error'
+}
+
+# Display formats for numeric result columns, keyed by display name
+_DISPLAY_FORMATS = {
+    _COLUMN_NAMES[col]: '${:.2f}' if col == 'current_price' else '{:.4f}'
+    for col in _NUMERIC_COLUMNS
+}
+
+# Accepted headers for the ticker column (compared stripped and lowercased)
+_TICKER_COLUMN_NAMES = frozenset({'ticker', 'symbol', 'stock', 'tickers', 'symbols'})
+
+# Placeholder values that are never valid tickers (empty strings fail the length check)
+_INVALID_TICKERS = frozenset({'N/A', 'NULL', 'NONE', 'ERROR'})
+
+# Characters stripped from ticker symbols
+_TICKER_RE = re.compile(r'[^A-Z0-9.-]')
+
+# Signal fills use full ARGB strings; 6-digit colors get a transparent 00 alpha
+_BUY_FILL = PatternFill(start_color='FF90EE90', end_color='FF90EE90', fill_type='solid')  # Light green
+_SELL_FILL = PatternFill(start_color='FFFFB6C1', end_color='FFFFB6C1', fill_type='solid')  # Light pink
+_HOLD_FILL = PatternFill(start_color='FFFFFFE0', end_color='FFFFFFE0', fill_type='solid')  # Light yellow
+_SIGNAL_FILLS = {'BUY': _BUY_FILL, 'HOLD': _HOLD_FILL, 'SELL': _SELL_FILL}
+
+# Bold header, matching the pandas to_excel header
+_HEADER_FONT = Font(bold=True)
+
+# Rows converted per step when streaming a DataFrame into a write-only sheet
+_EXCEL_CHUNK_ROWS = 1000
+
+
+def _column_widths(df: pd.DataFrame) -> np.ndarray:
+    """Excel column widths from the longest header or value, padded and capped at 50"""
+    header_widths = np.fromiter((len(str(col)) for col in df.columns), dtype=np.int64, count=len(df.columns))
+    data_widths = np.zeros(len(df.columns), dtype=np.int64)
+    for idx in range(len(df.columns)):
+        # Missing values are written as empty cells, so they do not count towards the width
+        values = df.iloc[:, idx].dropna().to_numpy()
+        if len(values):
+            data_widths[idx] = np.char.str_len(np.asarray(values, dtype=str)).max()
+    return np.minimum(np.maximum(header_widths, data_widths) + 2, 50)
+
+
+def _iter_excel_rows(df: pd.DataFrame):
+    """Yield DataFrame rows as lists with missing values as None, converting a chunk at a time"""
+    for start in range(0, len(df), _EXCEL_CHUNK_ROWS):
+        chunk = df.iloc[start:start + _EXCEL_CHUNK_ROWS]
+        values = chunk.astype(object).where(chunk.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            yield list(row)
+
+
+
+def _signal_column(columns) -> Optional[int]:
+    """Position of the signal column: an exact 'signal' header, else the first header containing it"""
+    names = [str(col).strip().lower() for col in columns]
+    if 'signal' in names:
+        return names.index('signal')
+    return next((idx for idx, name in enumerate(names) if 'signal' in name), None)
+
+
+def _write_results_workbook(df: pd.DataFrame, *, sheet_name: str) -> bytes:
+    """
+    Stream a results DataFrame into a single-sheet workbook with color coded signals
+    
+    Args:
+        df: Results DataFrame
+        sheet_name: Worksheet title
+        
+    Returns:
+        Excel file as bytes
+    """
+    output = io.BytesIO()
+    
+    # Write-only mode streams rows instead of building the full cell grid
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(sheet_name)
+    
+    # Auto-adjust column widths (must be set before rows are appended)
+    for idx, width in enumerate(_column_widths(df), 1):
+        worksheet.column_dimensions[get_column_letter(idx)].width = int(width)
+    
+    signal_col = _signal_column(df.columns)
+    
+    # Write header row
+    header = []
+    for col in df.columns:
+        cell = WriteOnlyCell(worksheet, value=col)
+        cell.font = _HEADER_FONT
+        header.append(cell)
+    worksheet.append(header)
+    
+    # Color code signals with conditional formatting rules instead of per-cell fills
+    if signal_col is not None and len(df):
+        letter = get_column_letter(signal_col + 1)
+        cell_range = f'{letter}2:{letter}{len(df) + 1}'
+        for signal, fill in _SIGNAL_FILLS.items():
+            worksheet.conditional_formatting.add(
+                cell_range, CellIsRule(operator='equal', formula=[f'"{signal}"'], fill=fill)
+            )
+    
+    # Write results
+    for row in _iter_excel_rows(df):
+        worksheet.append(row)
+    
+    workbook.save(output)
+    
+    return output.getbuffer().tobytes()
+
+def _read_ticker_column(reader, buffer: io.BytesIO, column: str) -> pd.Series:
+    """
+    Read the ticker column as text, so values like '0700' keep their leading zeros
+    
+    Args:
+        reader: pd.read_csv or pd.read_excel
+        buffer: In-memory file contents, positioned at the start
+        column: Name of the ticker column
+        
+    Returns:
+        Series of raw ticker strings
+    """
+    if reader is pd.read_csv and pa is not None:
+        # Declare the column type up front: pandas' pyarrow engine infers int64
+        # first and only casts to str afterwards, which drops leading zeros
+        try:
+            table = pa_csv.read_csv(buffer, convert_options=pa_csv.ConvertOptions(
+                column_types={column: pa.string()}, include_columns=[column]
+            ))
+            return table.column(column).to_pandas()
+        except pa.ArrowInvalid:
+            # e.g. a duplicated header pandas renamed; fall back to the C parser
+            buffer.seek(0)
+    
+    return reader(buffer, usecols=[column], dtype=str)[column]
+
+class TickerFileError(ValueError):
+    """Raised for uploaded ticker files that cannot be used, with a user-facing message"""
 
 class FileProcessor:
     """Handles file upload and processing operations"""
@@ -31,51 +207,75 @@ class FileProcessor:
             if uploaded_file is None:
                 return None
             
-            # Determine file type and read accordingly
-            if uploaded_file.name.endswith('.csv'):
-                df = pd.read_csv(uploaded_file)
-            elif uploaded_file.name.endswith(('.xlsx', '.xls')):
-                df = pd.read_excel(uploaded_file)
-            else:
-                st.error("Unsupported file format. Please upload CSV or Excel files.")
-                return None
-            
-            # Look for ticker column (case insensitive)
-            ticker_column = None
-            for col in df.columns:
-                if col.lower() in ['ticker', 'symbol', 'stock', 'tickers', 'symbols']:
-                    ticker_column = col
-                    break
-            
-            if ticker_column is None:
-                st.error("No 'Ticker' column found in the uploaded file. Please ensure your file has a column named 'Ticker'.")
-                return None
-            
-            # Extract tickers and clean them
-            tickers = df[ticker_column].dropna().astype(str).tolist()
-            cleaned_tickers = []
-            
-            for ticker in tickers:
-                # Clean ticker symbol
-                cleaned_ticker = FileProcessor.clean_ticker_symbol(ticker)
-                if cleaned_ticker:
-                    cleaned_tickers.append(cleaned_ticker)
-            
-            if not cleaned_tickers:
-                st.error("No valid ticker symbols found in the uploaded file.")
-                return None
-            
-            # Remove duplicates while preserving order
-            unique_tickers = list(dict.fromkeys(cleaned_tickers))
+            # Parsing is cached on the file contents, so reruns skip it
+            unique_tickers = FileProcessor._parse_tickers(uploaded_file.name, uploaded_file.getvalue())
             
             st.success(f"Successfully loaded {len(unique_tickers)} unique ticker symbols.")
             
             return unique_tickers
-            
+        
+        except TickerFileError as e:
+            st.error(str(e))
+            return None
         except Exception as e:
             st.error(f"Error processing uploaded file: {str(e)}")
             return None
     
+    @staticmethod
+    @st.cache_data(show_spinner=False, max_entries=8)
+    def _parse_tickers(name: str, content: bytes) -> List[str]:
+        """
+        Parse raw file contents into a de-duplicated ticker list
+        
+        Args:
+            name: Uploaded file name, used to detect the format
+            content: Raw file bytes
+        
+        Returns:
+            List of unique ticker symbols
+        
+        Raises:
+            TickerFileError: If the file format, ticker column or tickers are invalid
+        """
+        # Determine file type and read accordingly
+        if name.endswith('.csv'):
+            reader = pd.read_csv
+        elif name.endswith(('.xlsx', '.xls')):
+            reader = pd.read_excel
+        else:
+            raise TickerFileError("Unsupported file format. Please upload CSV or Excel files.")
+        
+        # Wrap the bytes once; every read below rewinds this in-memory buffer
+        buffer = io.BytesIO(content)
+        
+        # Probe the header only, so the full read can skip other columns
+        columns = reader(buffer, nrows=0).columns
+        buffer.seek(0)
+        
+        # Look for ticker column (case insensitive)
+        ticker_column = next(
+            (col for col in columns if str(col).strip().lower() in _TICKER_COLUMN_NAMES), None
+        )
+        
+        if ticker_column is None:
+            raise TickerFileError("No 'Ticker' column found in the uploaded file. Please ensure your file has a column named 'Ticker'.")
+        
+        raw_tickers = _read_ticker_column(reader, buffer, ticker_column)
+        
+        # Extract tickers and clean the whole column at once (same rules as clean_ticker_symbol)
+        tickers = (
+            raw_tickers.dropna().astype(str)
+            .str.strip().str.upper()
+            .str.replace(_TICKER_RE, '', regex=True)
+        )
+        tickers = tickers[tickers.str.len().between(1, 10) & ~tickers.isin(_INVALID_TICKERS)]
+        
+        if tickers.empty:
+            raise TickerFileError("No valid ticker symbols found in the uploaded file.")
+        
+        # Remove duplicates while preserving order
+        return tickers.drop_duplicates().tolist()
+    
     @staticmethod
     def clean_ticker_symbol(ticker: str) -> Optional[str]:
         """
@@ -94,15 +294,14 @@ class FileProcessor:
         ticker = str(ticker).strip().upper()
         
         # Remove common prefixes/suffixes and special characters
-        ticker = re.sub(r'[^A-Z0-9.-]', '', ticker)
+        ticker = _TICKER_RE.sub('', ticker)
         
         # Basic validation - ticker should be 1-5 characters for most exchanges
         if len(ticker) < 1 or len(ticker) > 10:
             return None
         
         # Skip obviously invalid entries
-        invalid_patterns = ['N/A', 'NULL', 'NONE', 'ERROR', '']
-        if ticker in invalid_patterns:
+        if ticker in _INVALID_TICKERS:
             return None
         
         return ticker
@@ -119,58 +318,7 @@ class FileProcessor:
             Excel file as bytes
         """
         try:
-            output = io.BytesIO()
-            
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                # Write main results
-                results_df.to_excel(writer, sheet_name='Stock Analysis Results', index=False)
-                
-                # Get the workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Stock Analysis Results']
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-                # Add formatting for signal column
-                from openpyxl.styles import PatternFill
-                
-                # Find signal column
-                signal_col = None
-                for idx, col in enumerate(results_df.columns, 1):
-                    if col.lower() == 'signal':
-                        signal_col = idx
-                        break
-                
-                if signal_col:
-                    # Color code signals
-                    buy_fill = PatternFill(start_color='90EE90', end_color='90EE90', fill_type='solid')  # Light green
-                    sell_fill = PatternFill(start_color='FFB6C1', end_color='FFB6C1', fill_type='solid')  # Light pink
-                    hold_fill = PatternFill(start_color='FFFFE0', end_color='FFFFE0', fill_type='solid')  # Light yellow
-                    
-                    for row in range(2, len(results_df) + 2):  # Skip header row
-                        cell = worksheet.cell(row=row, column=signal_col)
-                        if cell.value == 'BUY':
-                            cell.fill = buy_fill
-                        elif cell.value == 'SELL':
-                            cell.fill = sell_fill
-                        elif cell.value == 'HOLD':
-                            cell.fill = hold_fill
-            
-            output.seek(0)
-            return output.getvalue()
+            return _write_results_workbook(results_df, sheet_name='Stock Analysis Results')
             
         except Exception as e:
             st.error(f"Error creating Excel file: {str(e)}")
@@ -192,24 +340,27 @@ class WeightValidator:
             Tuple of (normalized_weights, is_valid)
         """
         try:
+            categories = list(weights.keys())
+            values = np.fromiter(weights.values(), dtype=np.float64, count=len(weights))
+            
             # Check if all weights are non-negative
-            for category, weight in weights.items():
-                if weight < 0:
-                    st.error(f"Weight for {category} cannot be negative.")
-                    return weights, False
+            negative = np.flatnonzero(values < 0)
+            if negative.size:
+                st.error(f"Weight for {categories[negative[0]]} cannot be negative.")
+                return weights, False
             
             # Calculate total weight
-            total_weight = sum(weights.values())
+            total_weight = float(values.sum())
             
             if total_weight == 0:
                 st.error("Total weight cannot be zero. Please assign positive weights.")
                 return weights, False
             
             # Normalize weights to sum to 1.0
-            normalized_weights = {k: v / total_weight for k, v in weights.items()}
+            normalized_weights = dict(zip(categories, (values / total_weight).tolist()))
             
             # Show normalization message if needed
-            if abs(total_weight - 1.0) > 0.001:
+            if not math.isclose(total_weight, 1.0, abs_tol=1e-3):
                 st.info(f"Weights normalized from total {total_weight:.3f} to 1.000")
             
             return normalized_weights, True
@@ -236,7 +387,7 @@ class SessionManager:
     @staticmethod
     def generate_session_id() -> str:
         """Generate unique session ID"""
-        return str(uuid.uuid4())[:8]
+        return secrets.token_hex(4)
     
     @staticmethod
     def create_session_summary(session_id: str, weights: Dict[str, float], 
@@ -266,6 +417,38 @@ class SessionManager:
 class DataFormatter:
     """Handles data formatting and display"""
     
+    @staticmethod
+    def top_n(df: pd.DataFrame, n: int, column: str = 'final_weighted_score') -> pd.DataFrame:
+        """
+        Select the n rows with the largest values in a column
+        
+        Matches DataFrame.nlargest, except that rows with a missing value are never
+        selected, even when fewer than n rows have one.
+        
+        Args:
+            df: DataFrame to select from
+            n: Number of rows to keep
+            column: Numeric column to rank by
+            
+        Returns:
+            The top n rows, highest value first (ties keep their original order)
+        """
+        values = df[column].to_numpy(dtype=float)
+        candidates = np.flatnonzero(~np.isnan(values))
+        if n <= 0 or candidates.size == 0:
+            return df.iloc[:0]
+        
+        # Find the n-th largest value in linear time, then sort only the rows above it;
+        # rows tied at that value are taken in their original order, as nlargest does
+        if n < candidates.size:
+            scores = values[candidates]
+            kth = np.partition(scores, -n)[-n]
+            above = candidates[scores > kth]
+            tied = candidates[scores == kth][:n - above.size]
+            candidates = np.concatenate((above, tied))
+        order = candidates[np.lexsort((candidates, -values[candidates]))]
+        return df.iloc[order]
+    
     @staticmethod
     def format_results_for_display(results: List[Dict]) -> pd.DataFrame:
         """
@@ -275,7 +458,7 @@ class DataFormatter:
             results: List of analysis result dictionaries
             
         Returns:
-            Formatted DataFrame
+            Sorted DataFrame with display column names and numeric values kept as numbers
         """
         try:
             if not results:
@@ -284,52 +467,16 @@ class DataFormatter:
             # Convert to DataFrame
             df = pd.DataFrame(results)
             
-            # Reorder columns for better display
-            column_order = [
-                'ticker', 'current_price', 'final_weighted_score', 'signal',
-                'momentum_score', 'trend_score', 'volatility_score', 
-                'strength_score', 'support_resistance_score', 'error_message'
-            ]
-            
-            # Only include columns that exist
-            existing_columns = [col for col in column_order if col in df.columns]
-            df = df[existing_columns]
-            
-            # Format numeric columns
-            numeric_columns = [
-                'current_price', 'final_weighted_score', 'momentum_score',
-                'trend_score', 'volatility_score', 'strength_score', 'support_resistance_score'
-            ]
-            
-            for col in numeric_columns:
-                if col in df.columns:
-                    if col == 'current_price':
-                        df[col] = df[col].apply(lambda x: f"${x:.2f}" if pd.notna(x) else "N/A")
-                    else:
-                        df[col] = df[col].apply(lambda x: f"{x:.4f}" if pd.notna(x) else "N/A")
+            # Reorder columns for better display, keeping only those that exist
+            df = df[[col for col in _COLUMN_ORDER if col in df.columns]]
             
-            # Rename columns for display
-            column_names = {
-                'ticker': 'Ticker',
-                'current_price': 'Current Price',
-                'final_weighted_score': 'Final Score',
-                'signal': 'Signal',
-                'momentum_score': 'Momentum',
-                'trend_score': 'Trend',
-                'volatility_score': 'Volatility',
-                'strength_score': 'Strength',
-                'support_resistance_score': 'Support/Resistance',
-                'error_message': 'Error'
-            }
+            # Sort by Final Score (descending) on the raw values, missing scores last
+            if 'final_weighted_score' in df.columns:
+                df = df.sort_values('final_weighted_score', ascending=False, kind='stable',
+                                    na_position='last', ignore_index=True)
             
-            df = df.rename(columns=column_names)
-            
-            # Sort by Final Score (descending)
-            if 'Final Score' in df.columns:
-                # Convert back to numeric for sorting
-                df['Final Score Numeric'] = df['Final Score'].str.replace('N/A', '0').astype(float)
-                df = df.sort_values('Final Score Numeric', ascending=False)
-                df = df.drop('Final Score Numeric', axis=1)
+            # Rename columns for display
+            df.rename(columns=_COLUMN_NAMES, inplace=True)
             
             return df
             
@@ -338,48 +485,70 @@ class DataFormatter:
             return pd.DataFrame()
     
     @staticmethod
-    def create_summary_stats(results: List[Dict]) -> Dict:
+    def style_results_for_display(display_df: pd.DataFrame):
+        """
+        Apply display formats to a DataFrame from format_results_for_display
+        
+        Args:
+            display_df: Formatted results DataFrame
+            
+        Returns:
+            Styler rendering prices and scores as text, with "N/A" for missing values
+        """
+        formats = {col: fmt for col, fmt in _DISPLAY_FORMATS.items() if col in display_df.columns}
+        return display_df.style.format(formats, na_rep="N/A")
+    
+    @staticmethod
+    def create_summary_stats(results: Union[List[Dict], pd.DataFrame]) -> Dict:
         """
         Create summary statistics from results
         
         Args:
-            results: List of analysis result dictionaries
+            results: List of analysis result dictionaries or a results DataFrame
             
         Returns:
             Summary statistics dictionary
         """
         try:
-            if not results:
+            if len(results) == 0:
                 return {}
             
+            df = results if isinstance(results, pd.DataFrame) else pd.DataFrame(results)
+            
             # Filter out results with errors
-            valid_results = [r for r in results if 'error_message' not in r or not r['error_message']]
+            if 'error_message' in df.columns:
+                errors = df['error_message']
+                mask = errors.isna() | (errors == '')
+                valid = df.loc[mask]
+            else:
+                valid = df
             
-            if not valid_results:
-                return {'total_analyzed': len(results), 'successful': 0, 'errors': len(results)}
+            if valid.empty:
+                return {'total_analyzed': len(df), 'successful': 0, 'errors': len(df)}
             
             # Calculate signal distribution
-            signals = [r['signal'] for r in valid_results]
+            signals = valid['signal'].value_counts()
             signal_counts = {
-                'BUY': signals.count('BUY'),
-                'HOLD': signals.count('HOLD'),
-                'SELL': signals.count('SELL')
+                'BUY': int(signals.get('BUY', 0)),
+                'HOLD': int(signals.get('HOLD', 0)),
+                'SELL': int(signals.get('SELL', 0))
             }
             
-            # Calculate score statistics
-            scores = [r['final_weighted_score'] for r in valid_results]
+            # Calculate score statistics from a single array
+            scores = valid['final_weighted_score'].to_numpy(dtype=np.float64)
+            score_min, score_median, score_max = np.percentile(scores, [0, 50, 100])
             
             summary = {
-                'total_analyzed': len(results),
-                'successful': len(valid_results),
-                'errors': len(results) - len(valid_results),
+                'total_analyzed': len(df),
+                'successful': len(valid),
+                'errors': len(df) - len(valid),
                 'signal_distribution': signal_counts,
                 'score_stats': {
-                    'mean': np.mean(scores),
-                    'median': np.median(scores),
-                    'std': np.std(scores),
-                    'min': np.min(scores),
-                    'max': np.max(scores)
+                    'mean': float(scores.mean()),
+                    'median': float(score_median),
+                    'std': float(scores.std()),
+                    'min': float(score_min),
+                    'max': float(score_max)
                 }
             }
             
@@ -407,61 +576,7 @@ class ExcelExporter:
             Excel file as bytes
         """
         try:
-            output = io.BytesIO()
-            
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Analysis Results', index=False)
-                
-                # Get the workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Analysis Results']
-                
-                # Add conditional formatting for signals
-                from openpyxl.styles import PatternFill
-                from openpyxl.formatting.rule import CellIsRule
-                
-                # Define colors for signals
-                buy_fill = PatternFill(start_color='90EE90', end_color='90EE90', fill_type='solid')  # Light green
-                hold_fill = PatternFill(start_color='FFFFE0', end_color='FFFFE0', fill_type='solid')  # Light yellow
-                sell_fill = PatternFill(start_color='FFB6C1', end_color='FFB6C1', fill_type='solid')  # Light red
-                
-                # Find the Signal column
-                signal_col = None
-                for col_num, col_name in enumerate(df.columns, 1):
-                    if 'Signal' in str(col_name):
-                        signal_col = col_num
-                        break
-                
-                if signal_col:
-                    # Apply conditional formatting
-                    worksheet.conditional_formatting.add(
-                        f'{chr(64 + signal_col)}2:{chr(64 + signal_col)}{len(df) + 1}',
-                        CellIsRule(operator='equal', formula=['"BUY"'], fill=buy_fill)
-                    )
-                    worksheet.conditional_formatting.add(
-                        f'{chr(64 + signal_col)}2:{chr(64 + signal_col)}{len(df) + 1}',
-                        CellIsRule(operator='equal', formula=['"HOLD"'], fill=hold_fill)
-                    )
-                    worksheet.conditional_formatting.add(
-                        f'{chr(64 + signal_col)}2:{chr(64 + signal_col)}{len(df) + 1}',
-                        CellIsRule(operator='equal', formula=['"SELL"'], fill=sell_fill)
-                    )
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            output.seek(0)
-            return output.getvalue()
+            return _write_results_workbook(df, sheet_name='Analysis Results')
             
         except Exception as e:
             st.error(f"Error exporting to Excel: {str(e)}")
@@ -500,127 +615,99 @@ class SummaryStats:
             return {}
     
     @staticmethod
-    def display_summary(summary: Dict):
+    @st.cache_data(show_spinner=False, max_entries=32)
+    def _summary_html(summary: Dict) -> str:
         """
-        Display enhanced summary statistics in Streamlit with beautiful design
+        Build the summary statistics markup in a single HTML block
         
         Args:
             summary: Summary statistics dictionary
-        """
-        try:
-            if not summary:
-                return
             
-            # Enhanced header with custom styling
-            st.markdown("""
+        Returns:
+            HTML string for the header, metric cards and score statistics
+        """
+        # Get values
+        total_tickers = summary.get('total_tickers', 0)
+        successful = summary.get('signal_distribution', {})
+        successful_count = sum(successful.values())
+        errors = total_tickers - successful_count if total_tickers > 0 else 0
+        avg_score = summary.get('average_score', 0)
+        score_range = summary.get('score_range', "N/A")
+        error_color = "#e74c3c" if errors > 0 else "#95a5a6"
+        
+        html = textwrap.dedent("""
+        <div style="
+            background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+            padding: 1rem;
+            border-radius: 10px;
+            margin-bottom: 1.5rem;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        ">
+            <h2 style="
+                color: white;
+                margin: 0;
+                text-align: center;
+                font-weight: 600;
+                font-size: 1.5rem;
+            ">📊 Summary Statistics</h2>
+        </div>
+        <div style="display: flex; gap: 1rem;">
             <div style="
-                background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-                padding: 1rem;
-                border-radius: 10px;
-                margin-bottom: 1.5rem;
-                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+                flex: 1;
+                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                padding: 1.5rem;
+                border-radius: 15px;
+                text-align: center;
+                color: white;
+                box-shadow: 0 8px 16px rgba(102, 126, 234, 0.3);
+                margin-bottom: 1rem;
             ">
-                <h2 style="
-                    color: white;
-                    margin: 0;
-                    text-align: center;
-                    font-weight: 600;
-                    font-size: 1.5rem;
-                ">📊 Summary Statistics</h2>
+                <h3 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">Total Analyzed</h3>
+                <h1 style="margin: 0.5rem 0 0 0; font-size: 2.5rem; font-weight: 700;">{total}</h1>
             </div>
-            """, unsafe_allow_html=True)
-            
-            # Get values
-            total_tickers = summary.get('total_tickers', 0)
-            successful = summary.get('signal_distribution', {})
-            errors = total_tickers - sum(successful.values()) if total_tickers > 0 else 0
-            avg_score = summary.get('average_score', 0)
-            
-            # Calculate score range
-            if 'score_range' in summary:
-                score_range = summary['score_range']
-            else:
-                score_range = "N/A"
-            
-            # Top metrics row with enhanced styling
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    padding: 1.5rem;
-                    border-radius: 15px;
-                    text-align: center;
-                    color: white;
-                    box-shadow: 0 8px 16px rgba(102, 126, 234, 0.3);
-                    margin-bottom: 1rem;
-                ">
-                    <h3 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">Total Analyzed</h3>
-                    <h1 style="margin: 0.5rem 0 0 0; font-size: 2.5rem; font-weight: 700;">{}</h1>
-                </div>
-                """.format(total_tickers), unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
-                    padding: 1.5rem;
-                    border-radius: 15px;
-                    text-align: center;
-                    color: white;
-                    box-shadow: 0 8px 16px rgba(17, 153, 142, 0.3);
-                    margin-bottom: 1rem;
-                ">
-                    <h3 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">Successful</h3>
-                    <h1 style="margin: 0.5rem 0 0 0; font-size: 2.5rem; font-weight: 700;">{}</h1>
-                </div>
-                """.format(sum(successful.values())), unsafe_allow_html=True)
-            
-            with col3:
-                error_color = "#e74c3c" if errors > 0 else "#95a5a6"
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, {} 0%, {} 100%);
-                    padding: 1.5rem;
-                    border-radius: 15px;
-                    text-align: center;
-                    color: white;
-                    box-shadow: 0 8px 16px rgba(231, 76, 60, 0.3);
-                    margin-bottom: 1rem;
-                ">
-                    <h3 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">Errors</h3>
-                    <h1 style="margin: 0.5rem 0 0 0; font-size: 2.5rem; font-weight: 700;">{}</h1>
-                </div>
-                """.format(error_color, error_color, errors), unsafe_allow_html=True)
-            
-            # Signal Distribution with enhanced cards
-            st.markdown("""
             <div style="
-                background: #f8f9fa;
+                flex: 1;
+                background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
                 padding: 1.5rem;
                 border-radius: 15px;
-                margin: 1.5rem 0;
-                border: 1px solid #e9ecef;
+                text-align: center;
+                color: white;
+                box-shadow: 0 8px 16px rgba(17, 153, 142, 0.3);
+                margin-bottom: 1rem;
             ">
-                <h3 style="
-                    color: #495057;
-                    margin: 0 0 1rem 0;
-                    font-weight: 600;
-                    text-align: center;
-                ">Signal Distribution:</h3>
-            """, unsafe_allow_html=True)
-            
-            # Signal cards
-            col1, col2, col3 = st.columns(3)
-            
-            buy_count = successful.get('BUY', 0)
-            hold_count = successful.get('HOLD', 0)
-            sell_count = successful.get('SELL', 0)
-            
-            with col1:
-                st.markdown("""
+                <h3 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">Successful</h3>
+                <h1 style="margin: 0.5rem 0 0 0; font-size: 2.5rem; font-weight: 700;">{successful}</h1>
+            </div>
+            <div style="
+                flex: 1;
+                background: linear-gradient(135deg, {error_color} 0%, {error_color} 100%);
+                padding: 1.5rem;
+                border-radius: 15px;
+                text-align: center;
+                color: white;
+                box-shadow: 0 8px 16px rgba(231, 76, 60, 0.3);
+                margin-bottom: 1rem;
+            ">
+                <h3 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">Errors</h3>
+                <h1 style="margin: 0.5rem 0 0 0; font-size: 2.5rem; font-weight: 700;">{errors}</h1>
+            </div>
+        </div>
+        <div style="
+            background: #f8f9fa;
+            padding: 1.5rem;
+            border-radius: 15px;
+            margin: 1.5rem 0;
+            border: 1px solid #e9ecef;
+        ">
+            <h3 style="
+                color: #495057;
+                margin: 0 0 1rem 0;
+                font-weight: 600;
+                text-align: center;
+            ">Signal Distribution:</h3>
+            <div style="display: flex; gap: 1rem;">
                 <div style="
+                    flex: 1;
                     background: linear-gradient(135deg, #2ecc71 0%, #27ae60 100%);
                     padding: 1.5rem;
                     border-radius: 12px;
@@ -629,13 +716,10 @@ class SummaryStats:
                     box-shadow: 0 6px 12px rgba(46, 204, 113, 0.3);
                 ">
                     <h4 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">BUY</h4>
-                    <h2 style="margin: 0.5rem 0 0 0; font-size: 2rem; font-weight: 700;">{}</h2>
+                    <h2 style="margin: 0.5rem 0 0 0; font-size: 2rem; font-weight: 700;">{buy}</h2>
                 </div>
-                """.format(buy_count), unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("""
                 <div style="
+                    flex: 1;
                     background: linear-gradient(135deg, #f39c12 0%, #e67e22 100%);
                     padding: 1.5rem;
                     border-radius: 12px;
@@ -644,13 +728,10 @@ class SummaryStats:
                     box-shadow: 0 6px 12px rgba(243, 156, 18, 0.3);
                 ">
                     <h4 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">HOLD</h4>
-                    <h2 style="margin: 0.5rem 0 0 0; font-size: 2rem; font-weight: 700;">{}</h2>
+                    <h2 style="margin: 0.5rem 0 0 0; font-size: 2rem; font-weight: 700;">{hold}</h2>
                 </div>
-                """.format(hold_count), unsafe_allow_html=True)
-            
-            with col3:
-                st.markdown("""
                 <div style="
+                    flex: 1;
                     background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
                     padding: 1.5rem;
                     border-radius: 12px;
@@ -659,76 +740,90 @@ class SummaryStats:
                     box-shadow: 0 6px 12px rgba(231, 76, 60, 0.3);
                 ">
                     <h4 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">SELL</h4>
-                    <h2 style="margin: 0.5rem 0 0 0; font-size: 2rem; font-weight: 700;">{}</h2>
+                    <h2 style="margin: 0.5rem 0 0 0; font-size: 2rem; font-weight: 700;">{sell}</h2>
                 </div>
-                """.format(sell_count), unsafe_allow_html=True)
-            
-            st.markdown("</div>", unsafe_allow_html=True)
-            
-            # Score Statistics with enhanced styling
-            st.markdown("""
+            </div>
+        </div>
+        <div style="
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            padding: 1.5rem;
+            border-radius: 15px;
+            margin: 1.5rem 0;
+            color: white;
+            box-shadow: 0 8px 16px rgba(102, 126, 234, 0.3);
+        ">
+            <h3 style="
+                margin: 0 0 1rem 0;
+                font-weight: 600;
+                text-align: center;
+            ">Score Statistics:</h3>
+            <div style="display: flex; gap: 1rem;">
+                <div style="flex: 1; text-align: center; padding: 1rem;">
+                    <h4 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">Average Score</h4>
+                    <h2 style="margin: 0.5rem 0 0 0; font-size: 1.8rem; font-weight: 700;">{avg_score:.4f}</h2>
+                </div>
+                <div style="flex: 1; text-align: center; padding: 1rem;">
+                    <h4 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">Score Range</h4>
+                    <h2 style="margin: 0.5rem 0 0 0; font-size: 1.2rem; font-weight: 700;">{score_range}</h2>
+                </div>
+            </div>
+        </div>
+        """).strip().format(
+            total=total_tickers,
+            successful=successful_count,
+            error_color=error_color,
+            errors=errors,
+            buy=successful.get('BUY', 0),
+            hold=successful.get('HOLD', 0),
+            sell=successful.get('SELL', 0),
+            avg_score=avg_score,
+            score_range=score_range
+        )
+        
+        # Both pieces are dedented and joined without a blank line, otherwise
+        # markdown treats the indented chart header as a code block
+        if any(successful.values()):
+            html += "\n" + textwrap.dedent("""
             <div style="
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                padding: 1.5rem;
-                border-radius: 15px;
-                margin: 1.5rem 0;
-                color: white;
-                box-shadow: 0 8px 16px rgba(102, 126, 234, 0.3);
+                background: white;
+                padding: 1.5rem 1.5rem 0.5rem 1.5rem;
+                border-radius: 15px 15px 0 0;
+                margin: 1.5rem 0 0 0;
+                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+                border: 1px solid #e9ecef;
             ">
                 <h3 style="
-                    margin: 0 0 1rem 0;
+                    color: #495057;
+                    margin: 0;
                     font-weight: 600;
                     text-align: center;
-                ">Score Statistics:</h3>
-            """, unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("""
-                <div style="text-align: center; padding: 1rem;">
-                    <h4 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">Average Score</h4>
-                    <h2 style="margin: 0.5rem 0 0 0; font-size: 1.8rem; font-weight: 700;">{:.4f}</h2>
-                </div>
-                """.format(avg_score), unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("""
-                <div style="text-align: center; padding: 1rem;">
-                    <h4 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">Score Range</h4>
-                    <h2 style="margin: 0.5rem 0 0 0; font-size: 1.2rem; font-weight: 700;">{}</h2>
-                </div>
-                """.format(score_range), unsafe_allow_html=True)
+                ">📈 Signal Distribution Chart</h3>
+            </div>
+            """).strip()
+        
+        return html
+    
+    @staticmethod
+    def display_summary(summary: Dict):
+        """
+        Display enhanced summary statistics in Streamlit with beautiful design
+        
+        Args:
+            summary: Summary statistics dictionary
+        """
+        try:
+            if not summary:
+                return
             
-            st.markdown("</div>", unsafe_allow_html=True)
+            # Markup is memoized on the summary contents, so reruns with an
+            # unchanged summary skip rebuilding it and emit a single element
+            st.markdown(SummaryStats._summary_html(summary), unsafe_allow_html=True)
             
             # Enhanced signal distribution chart
-            if summary.get('signal_distribution'):
-                signal_data = summary['signal_distribution']
-                if any(signal_data.values()):
-                    st.markdown("""
-                    <div style="
-                        background: white;
-                        padding: 1.5rem;
-                        border-radius: 15px;
-                        margin: 1.5rem 0;
-                        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-                        border: 1px solid #e9ecef;
-                    ">
-                        <h3 style="
-                            color: #495057;
-                            margin: 0 0 1rem 0;
-                            font-weight: 600;
-                            text-align: center;
-                        ">📈 Signal Distribution Chart</h3>
-                    """, unsafe_allow_html=True)
-                    
-                    # Create a more colorful chart
-                    import pandas as pd
-                    chart_df = pd.DataFrame(list(signal_data.items()), columns=['Signal', 'Count'])
-                    st.bar_chart(chart_df.set_index('Signal'), use_container_width=True)
-                    
-                    st.markdown("</div>", unsafe_allow_html=True)
+            signal_data = summary.get('signal_distribution')
+            if signal_data and any(signal_data.values()):
+                chart_df = pd.DataFrame(list(signal_data.items()), columns=['Signal', 'Count'])
+                st.bar_chart(chart_df.set_index('Signal'), use_container_width=True)
                     
         except Exception as e:
             st.error(f"Error displaying summary: {str(e)}")
@@ -9,15 +9,20 @@ Can be used independently or chained with KPI scoring results.
 import streamlit as st
 import pandas as pd
 import numpy as np
-import os
-import json
-from datetime import datetime, timedelta
-from typing import List, Dict
+import io
+import re
+from datetime import datetime
+from typing import Dict
+
+# Arrow's C++ CSV writer is used for downloads when pyarrow is installed
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
 
 # Import custom modules
 from modules.sentiment_analyzer import SentimentAnalyzer
-from modules.utils import FileProcessor, ExcelExporter
-from modules.database_utils import DatabaseUtils
 
 # Page configuration
 st.set_page_config(
@@ -28,7 +33,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+APP_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -56,7 +61,81 @@ st.markdown("""
         font-weight: bold;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(APP_CSS, unsafe_allow_html=True)
+
+# Ticker separators accepted in text input: commas, semicolons and any whitespace
+TICKER_SPLIT = re.compile(r'[,\s;]+')
+
+# Score columns colored by sign in the results table
+SENTIMENT_COLUMNS = ['X', 'Reddit', 'StockTwits', 'SentimentTotal']
+
+def style_sentiment(scores: pd.DataFrame) -> pd.DataFrame:
+    """Build the CSS for a block of sentiment scores: green positive, red negative, grey neutral"""
+    values = scores.to_numpy()
+    css = np.where(
+        values > 0, 'color: #28a745; font-weight: bold',
+        np.where(values < 0, 'color: #dc3545; font-weight: bold', 'color: #6c757d; font-weight: bold')
+    )
+    return pd.DataFrame(css, index=scores.index, columns=scores.columns)
+
+@st.cache_resource(show_spinner=False)
+def get_analyzer() -> SentimentAnalyzer:
+    """Create the sentiment analyzer once and share it across reruns"""
+    return SentimentAnalyzer()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_api_status(_analyzer: SentimentAnalyzer) -> Dict[str, bool]:
+    """API availability, refreshed at most once a minute"""
+    return _analyzer.get_api_status()
+
+def results_to_csv(df: pd.DataFrame) -> bytes:
+    """Encode results as CSV bytes, using pyarrow when available"""
+    if pa is None:
+        return df.to_csv(index=False).encode('utf-8')
+    buffer = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buffer)
+    return buffer.getvalue()
+
+def render_info_panel():
+    """Explain data sources, scoring and KPI integration below the analysis"""
+    st.markdown("---")
+    st.subheader("ℹ️ How Sentiment Scoring Works")
+    
+    with st.expander("📱 Data Sources"):
+        st.markdown("""
+        **X (Twitter)**: Uses Grok API to search for mentions and classify sentiment
+        
+        **Reddit**: Searches relevant subreddits (stocks, wallstreetbets, investing) for ticker mentions
+        
+        **StockTwits**: Uses public API to get sentiment-tagged messages
+        """)
+    
+    with st.expander("🧮 Scoring Method"):
+        st.markdown("""
+        **Raw Count System** (not averages):
+        - Each bullish/positive mention = +1
+        - Each bearish/negative mention = -1
+        - Neutral mentions = 0
+        
+        **Example**: 5 bullish - 2 bearish = +3 net sentiment
+        
+        **SentimentTotal** = Sum of all platform scores for quick ranking
+        """)
+    
+    with st.expander("🔗 Integration with KPI Scoring"):
+        st.markdown("""
+        This sentiment tool can work:
+        
+        **Standalone**: Analyze sentiment for any ticker list
+        
+        **Chained with KPI**: 
+        1. Run KPI Scoring to rank all tickers
+        2. Extract Top 10 performers  
+        3. Run Sentiment Analysis on those tickers
+        4. Get combined technical + sentiment insights
+        """)
 
 def main():
     """Main application function"""
@@ -77,13 +156,13 @@ def main():
     st.sidebar.header("⚙️ Configuration")
     
     # API Status Check
-    sentiment_analyzer = SentimentAnalyzer()
-    api_status = sentiment_analyzer.get_api_status()
+    sentiment_analyzer = get_analyzer()
+    api_status = get_api_status(sentiment_analyzer)
     
     st.sidebar.subheader("📡 API Status")
-    for api_name, status in api_status.items():
-        status_icon = "✅" if status else "❌"
-        st.sidebar.write(f"{status_icon} {api_name}")
+    st.sidebar.markdown("  \n".join(
+        f"{'✅' if status else '❌'} {api_name}" for api_name, status in api_status.items()
+    ))
     
     if not any(api_status.values()):
         st.error("⚠️ No APIs are configured. Please set up at least one API to use sentiment analysis.")
@@ -93,7 +172,7 @@ def main():
         - `REDDIT_CLIENT_ID` & `REDDIT_CLIENT_SECRET`: Reddit API
         - StockTwits: No API key required (public API)
         """)
-        return
+        st.stop()
     
     # Time range configuration
     st.sidebar.subheader("⏰ Time Range")
@@ -128,11 +207,8 @@ def main():
             )
             
             if ticker_input:
-                # Parse tickers from input
-                if ',' in ticker_input:
-                    tickers = [t.strip().upper() for t in ticker_input.split(',') if t.strip()]
-                else:
-                    tickers = [t.strip().upper() for t in ticker_input.split('\n') if t.strip()]
+                # Parse tickers from input, accepting any mix of delimiters
+                tickers = [t.upper() for t in TICKER_SPLIT.split(ticker_input) if t]
         
         elif input_method == "Upload File":
             uploaded_file = st.file_uploader(
@@ -143,6 +219,7 @@ def main():
             
             if uploaded_file:
                 try:
+                    from modules.utils import FileProcessor
                     processor = FileProcessor()
                     tickers = processor.process_file(uploaded_file)
                     st.success(f"✅ Loaded {len(tickers)} tickers from file")
@@ -180,7 +257,7 @@ def main():
             )
             
             if manual_override:
-                tickers = [t.strip().upper() for t in manual_override.split(',') if t.strip()]
+                tickers = [t.upper() for t in TICKER_SPLIT.split(manual_override) if t]
     
     with col2:
         st.subheader("📊 Analysis Summary")
@@ -208,120 +285,83 @@ def main():
                 # Run sentiment analysis
                 results_df = sentiment_analyzer.get_sentiment_for_tickers(tickers, hours_back)
                 
-                if not results_df.empty:
-                    # Format results
-                    formatted_df = sentiment_analyzer.format_sentiment_results(results_df)
-                    
-                    # Display results
-                    st.success(f"✅ Sentiment analysis completed for {len(results_df)} tickers!")
-                    
-                    # Summary metrics
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    with col1:
-                        positive_count = len(formatted_df[formatted_df['SentimentTotal'] > 0])
-                        st.metric("Positive Sentiment", positive_count)
-                    
-                    with col2:
-                        neutral_count = len(formatted_df[formatted_df['SentimentTotal'] == 0])
-                        st.metric("Neutral Sentiment", neutral_count)
-                    
-                    with col3:
-                        negative_count = len(formatted_df[formatted_df['SentimentTotal'] < 0])
-                        st.metric("Negative Sentiment", negative_count)
-                    
-                    with col4:
-                        avg_sentiment = formatted_df['SentimentTotal'].mean()
-                        st.metric("Average Sentiment", f"{avg_sentiment:.2f}")
-                    
-                    # Results table
-                    st.subheader("📋 Detailed Results")
-                    
-                    # Style the dataframe
-                    def style_sentiment(val):
-                        if val > 0:
-                            return 'color: #28a745; font-weight: bold'
-                        elif val < 0:
-                            return 'color: #dc3545; font-weight: bold'
-                        else:
-                            return 'color: #6c757d; font-weight: bold'
-                    
-                    styled_df = formatted_df.style.applymap(
-                        style_sentiment, 
-                        subset=['X', 'Reddit', 'StockTwits', 'SentimentTotal']
-                    )
-                    
-                    st.dataframe(styled_df, use_container_width=True)
-                    
-                    # Export options
-                    st.subheader("💾 Export Results")
-                    
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        # Excel export
-                        excel_data = ExcelExporter.export_results(formatted_df, "sentiment_analysis_results.xlsx")
-                        if excel_data:
-                            st.download_button(
-                                label="📊 Download Excel Report",
-                                data=excel_data,
-                                file_name=f"sentiment_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                            )
-                    
-                    with col2:
-                        # CSV export
-                        csv_data = formatted_df.to_csv(index=False)
+                if results_df.empty:
+                    st.error("❌ No sentiment data could be retrieved. Please check your API configurations and try again.")
+                    render_info_panel()
+                    st.stop()
+                
+                # Format results
+                formatted_df = sentiment_analyzer.format_sentiment_results(results_df)
+                
+                # Display results
+                st.success(f"✅ Sentiment analysis completed for {len(results_df)} tickers!")
+                
+                # Summary metrics, counting negative/neutral/positive totals in one pass
+                totals = results_df['SentimentTotal'].to_numpy()
+                negative_count, neutral_count, positive_count = np.bincount(
+                    np.sign(totals).astype(np.int64) + 1, minlength=3
+                )
+                avg_sentiment = totals.mean()
+                
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    st.metric("Positive Sentiment", int(positive_count))
+                
+                with col2:
+                    st.metric("Neutral Sentiment", int(neutral_count))
+                
+                with col3:
+                    st.metric("Negative Sentiment", int(negative_count))
+                
+                with col4:
+                    st.metric("Average Sentiment", f"{avg_sentiment:.2f}")
+                
+                # Results table
+                st.subheader("📋 Detailed Results")
+                
+                # Style the dataframe, coloring all score cells in one vectorized pass and
+                # showing signed scores at render time without another DataFrame copy
+                styled_df = formatted_df.style.apply(
+                    style_sentiment,
+                    axis=None,
+                    subset=SENTIMENT_COLUMNS
+                ).format('{:+d}', subset=SENTIMENT_COLUMNS)
+                
+                st.dataframe(styled_df, use_container_width=True)
+                
+                # Export options
+                st.subheader("💾 Export Results")
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    # Excel export
+                    from modules.utils import ExcelExporter
+                    excel_data = ExcelExporter.export_results(formatted_df, "sentiment_analysis_results.xlsx")
+                    if excel_data:
                         st.download_button(
-                            label="📄 Download CSV",
-                            data=csv_data,
-                            file_name=f"sentiment_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                            mime="text/csv"
+                            label="📊 Download Excel Report",
+                            data=excel_data,
+                            file_name=f"sentiment_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
                         )
-                    
-                    # Save to session state for potential chaining
-                    st.session_state['sentiment_results'] = formatted_df
-                    
-                else:
-                    st.error("❌ No sentiment data could be retrieved. Please check your API configurations and try again.")
+                
+                with col2:
+                    # CSV export
+                    csv_data = results_to_csv(formatted_df)
+                    st.download_button(
+                        label="📄 Download CSV",
+                        data=csv_data,
+                        file_name=f"sentiment_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                        mime="text/csv"
+                    )
+                
+                # Save to session state for potential chaining
+                st.session_state['sentiment_results'] = formatted_df
     
     # Information panel
-    st.markdown("---")
-    st.subheader("ℹ️ How Sentiment Scoring Works")
-    
-    with st.expander("📱 Data Sources"):
-        st.markdown("""
-        **X (Twitter)**: Uses Grok API to search for mentions and classify sentiment
-        
-        **Reddit**: Searches relevant subreddits (stocks, wallstreetbets, investing) for ticker mentions
-        
-        **StockTwits**: Uses public API to get sentiment-tagged messages
-        """)
-    
-    with st.expander("🧮 Scoring Method"):
-        st.markdown("""
-        **Raw Count System** (not averages):
-        - Each bullish/positive mention = +1
-        - Each bearish/negative mention = -1
-        - Neutral mentions = 0
-        
-        **Example**: 5 bullish - 2 bearish = +3 net sentiment
-        
-        **SentimentTotal** = Sum of all platform scores for quick ranking
-        """)
-    
-    with st.expander("🔗 Integration with KPI Scoring"):
-        st.markdown("""
-        This sentiment tool can work:
-        
-        **Standalone**: Analyze sentiment for any ticker list
-        
-        **Chained with KPI**: 
-        1. Run KPI Scoring to rank all tickers
-        2. Extract Top 10 performers  
-        3. Run Sentiment Analysis on those tickers
-        4. Get combined technical + sentiment insights
-        """)
+    render_info_panel()
 
 if __name__ == "__main__":
     main()
@@ -7,17 +7,49 @@ import psycopg2
 import os
 import sys
 
+# Composite (session_id, ticker) indexes: (index name, table)
+SESSION_TICKER_INDEXES = [
+    ('idx_ticker_results_session_ticker', 'ticker_results'),
+    ('idx_indicator_data_session_ticker', 'indicator_data'),
+]
+
+# Single-column indexes covered by the composite ones above; dropped on existing databases
+SUPERSEDED_INDEXES = [
+    'idx_ticker_results_session_id',
+    'idx_ticker_results_ticker',
+    'idx_indicator_data_session_id',
+    'idx_indicator_data_ticker',
+]
+
 def create_database_schema(database_url: str):
-    """Create the database schema"""
+    """Create the database schema (set LIVE_MIGRATION=1 to build indexes CONCURRENTLY)"""
     
     try:
         # Connect to database
         conn = psycopg2.connect(database_url)
+        # DDL runs without an explicit transaction; a multi-statement batch is still
+        # applied atomically by the server
+        conn.autocommit = True
+        live_migration = os.getenv('LIVE_MIGRATION') == '1'
         cursor = conn.cursor()
         
         print("Connected to database successfully!")
         
-        # Create analysis_sessions table
+        # Composite indexes serve both session lookups and (session_id, ticker) lookups,
+        # so they replace the old single-column indexes (dropped once the new ones exist)
+        concurrently = "CONCURRENTLY " if live_migration else ""
+        index_statements = [
+            f"CREATE INDEX {concurrently}IF NOT EXISTS {name} ON {table}(session_id, ticker);"
+            for name, table in SESSION_TICKER_INDEXES
+        ] + [
+            f"DROP INDEX {concurrently}IF EXISTS {name};"
+            for name in SUPERSEDED_INDEXES
+        ]
+        index_sql = "\n".join(index_statements)
+        
+        # Create all tables (and indexes, unless migrating live) in a single round trip.
+        # Scores and indicator values are floats, so they use fixed-width float types;
+        # only current_price keeps exact cents
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS analysis_sessions (
                 id SERIAL PRIMARY KEY,
@@ -27,71 +59,43 @@ def create_database_schema(database_url: str):
                 total_tickers INTEGER,
                 status VARCHAR(20) DEFAULT 'pending'
             );
-        """)
-        
-        print("Created analysis_sessions table")
-        
-        # Create ticker_results table
-        cursor.execute("""
+            
             CREATE TABLE IF NOT EXISTS ticker_results (
                 id SERIAL PRIMARY KEY,
                 session_id VARCHAR(50) REFERENCES analysis_sessions(session_id),
                 ticker VARCHAR(10) NOT NULL,
                 current_price DECIMAL(10,2),
-                momentum_score DECIMAL(5,4),
-                trend_score DECIMAL(5,4),
-                volatility_score DECIMAL(5,4),
-                strength_score DECIMAL(5,4),
-                support_resistance_score DECIMAL(5,4),
-                final_weighted_score DECIMAL(5,4),
+                momentum_score REAL,
+                trend_score REAL,
+                volatility_score REAL,
+                strength_score REAL,
+                support_resistance_score REAL,
+                final_weighted_score REAL,
                 signal VARCHAR(4) CHECK (signal IN ('BUY', 'HOLD', 'SELL')),
                 error_message TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
-        """)
-        
-        print("Created ticker_results table")
-        
-        # Create indicator_data table
-        cursor.execute("""
+            
             CREATE TABLE IF NOT EXISTS indicator_data (
                 id SERIAL PRIMARY KEY,
                 session_id VARCHAR(50) REFERENCES analysis_sessions(session_id),
                 ticker VARCHAR(10) NOT NULL,
                 indicator_name VARCHAR(50) NOT NULL,
-                indicator_value DECIMAL(10,6),
-                normalized_value DECIMAL(5,4),
+                indicator_value DOUBLE PRECISION,
+                normalized_value REAL,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
-        """)
+        """ + ("" if live_migration else index_sql))
         
-        print("Created indicator_data table")
-        
-        # Create indexes for better performance
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_ticker_results_session_id 
-            ON ticker_results(session_id);
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_ticker_results_ticker 
-            ON ticker_results(ticker);
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_indicator_data_session_id 
-            ON indicator_data(session_id);
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_indicator_data_ticker 
-            ON indicator_data(ticker);
-        """)
+        # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block (including an
+        # implicit multi-statement one), so on a live database each index is its own statement
+        if live_migration:
+            for statement in index_statements:
+                cursor.execute(statement)
         
-        print("Created database indexes")
+        print("Created analysis_sessions, ticker_results and indicator_data tables")
+        print("Created database indexes and dropped superseded single-column indexes")
         
-        # Commit changes
-        conn.commit()
         cursor.close()
         conn.close()
         
@@ -3,9 +3,9 @@
 Test the clean single-mode sentiment analyzer
 """
 
+import traceback
 import sys
 import os
-sys.path.append('/home/ubuntu/Btock')
 
 def test_clean_sentiment_analyzer():
     """Test the clean single-mode sentiment analyzer"""
@@ -60,7 +60,6 @@ def test_clean_sentiment_analyzer():
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -3,37 +3,51 @@
 Test the correct X API integration
 """
 
-import sys
-import os
+import traceback
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone, timedelta
-sys.path.append('/home/ubuntu/Btock')
+from _pool import secret
+
+# X API configuration; the key is read once from the environment or a local .env file
+API_KEY = secret("XAI_API_KEY")
+API_URL = "https://api.x.ai/v1/messages"
+MODEL = "grok-3"
+
+# Pooled keep-alive session with retries for transient failures
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset({'GET', 'POST'}), raise_on_status=False)
+))
 
 def test_correct_x_api():
     """Test the correct X API configuration"""
     
     print("🧪 Testing Correct X API Integration...")
     
-    # Use the correct X API configuration
-    api_key = "xai-D2gvIxMfaNn9kzadd4JvxL632GAGz5nHaO4DqbQy3cn1E23qaQDcvOcdhxURf"
-    api_url = "https://api.x.ai/v1/messages"
-    model = "grok-3"
+    if not API_KEY:
+        print("❌ XAI_API_KEY is not set - export it or add it to .env")
+        return False
     
     print(f"🔍 Testing Configuration:")
-    print(f"   API Key: {api_key[:10]}...{api_key[-4:]}")
-    print(f"   API URL: {api_url}")
-    print(f"   Model: {model}")
+    print(f"   API Key: {API_KEY[:10]}...{API_KEY[-4:]}")
+    print(f"   API URL: {API_URL}")
+    print(f"   Model: {MODEL}")
     
     # Test the API manually first
     headers = {
-        "Authorization": f"Bearer {api_key}",
+        "Authorization": f"Bearer {API_KEY}",
         "Content-Type": "application/json"
     }
     
     messages = [{"role": "user", "content": "Analyze recent X posts about $AAPL stock. Count positive vs negative sentiment mentions. Return format: 'positive: X, negative: Y'"}]
     
     payload = {
-        "model": model,
+        "model": MODEL,
         "messages": messages,
         "max_tokens": 100,
         "temperature": 0.3
@@ -41,28 +55,28 @@ def test_correct_x_api():
     
     try:
         print(f"\n🚀 Making direct API request...")
-        response = requests.post(api_url, headers=headers, json=payload, timeout=30)
-        
-        print(f"   Status Code: {response.status_code}")
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"   ✅ SUCCESS: API working!")
-            print(f"   Response: {data}")
+        # Streamed so an error page is never buffered past the printed snippet
+        with SESSION.post(API_URL, headers=headers, json=payload, timeout=30, stream=True) as response:
+            print(f"   Status Code: {response.status_code}")
             
-            # Test response parsing
-            if "content" in data and len(data["content"]) > 0:
-                content = data["content"][0]["text"]
-                print(f"   Content: {content}")
-                return True
+            if response.status_code == 200:
+                data = response.json()
+                print(f"   ✅ SUCCESS: API working!")
+                print(f"   Response: {data}")
+                
+                # Test response parsing
+                if "content" in data and len(data["content"]) > 0:
+                    content = data["content"][0]["text"]
+                    print(f"   Content: {content}")
+                    return True
+                else:
+                    print(f"   ⚠️  Unexpected response format: {data}")
+                    return False
+                    
             else:
-                print(f"   ⚠️  Unexpected response format: {data}")
+                print(f"   ❌ Error: {response.status_code}")
+                print(f"   Response: {response.raw.read(256, decode_content=True).decode('utf-8', 'replace')}")
                 return False
-                
-        else:
-            print(f"   ❌ Error: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return False
             
     except Exception as e:
         print(f"   ❌ Exception: {e}")
@@ -73,17 +87,13 @@ def test_sentiment_analyzer_integration():
     
     print("\n🧪 Testing Sentiment Analyzer Integration...")
     
-    # Set up environment variables with correct configuration
-    os.environ["XAI_API_KEY"] = "xai-D2gvIxMfaNn9kzadd4JvxL632GAGz5nHaO4DqbQy3cn1E23qaQDcvOcdhxURf"
-    os.environ["XAI_API_URL"] = "https://api.x.ai/v1/messages"
-    os.environ["XAI_MODEL"] = "grok-3"
-    
     try:
         from modules.sentiment_analyzer import SentimentAnalyzer
         print("✅ Import successful")
         
-        # Initialize analyzer
-        analyzer = SentimentAnalyzer()
+        # Initialize analyzer with the configuration passed explicitly
+        creds = {"XAI_API_KEY": API_KEY, "XAI_MODEL": MODEL} if API_KEY else {"XAI_MODEL": MODEL}
+        analyzer = SentimentAnalyzer(creds=creds, base_url=API_URL)
         print("✅ Initialization successful")
         
         # Check X API status
@@ -119,7 +129,6 @@ def test_sentiment_analyzer_integration():
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
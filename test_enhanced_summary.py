@@ -3,9 +3,8 @@
 Test the enhanced summary statistics display
 """
 
-import sys
+import traceback
 import streamlit as st
-sys.path.append('/home/ubuntu/Btock')
 
 def test_enhanced_summary():
     """Test the enhanced summary statistics display"""
@@ -51,7 +50,6 @@ def test_enhanced_summary():
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -18,26 +18,19 @@ def test_table_scrolling():
     st.header("🧪 Testing Table Horizontal Scrolling")
     
     # Create a wide test dataframe
-    test_data = {
-        'Ticker': ['AAPL', 'TSLA', 'MSFT', 'GOOGL', 'AMZN'],
-        'Price': [175.43, 242.65, 338.11, 138.21, 144.05],
-        'Final Score': [0.6543, 0.4321, 0.7890, 0.3456, 0.5678],
-        'Signal': ['BUY', 'HOLD', 'BUY', 'HOLD', 'BUY'],
-        'Momentum Score': [0.45, 0.23, 0.67, 0.12, 0.34],
-        'Trend Score': [0.78, 0.56, 0.89, 0.45, 0.67],
-        'Volatility Score': [0.34, 0.67, 0.23, 0.78, 0.45],
-        'Strength Score': [0.56, 0.34, 0.78, 0.23, 0.56],
-        'Support/Resistance': [0.67, 0.45, 0.34, 0.67, 0.78],
-        'RSI': [65.4, 45.2, 72.1, 38.9, 58.7],
-        'MACD': [0.45, -0.23, 0.67, -0.12, 0.34],
-        'ATR': [2.34, 8.67, 3.45, 4.23, 5.67],
-        'ADX': [25.6, 18.9, 32.4, 15.7, 28.3],
-        'Stochastic': [78.9, 34.5, 85.2, 23.1, 67.4],
-        'Williams %R': [-15.6, -67.8, -12.3, -78.9, -34.5],
-        'CCI': [145.6, -89.3, 167.8, -123.4, 78.9]
-    }
-    
-    test_df = pd.DataFrame(test_data)
+    tickers = np.array(['AAPL', 'TSLA', 'MSFT', 'GOOGL', 'AMZN'])
+    signals = np.array(['BUY', 'HOLD', 'BUY', 'HOLD', 'BUY'])
+    numeric_columns = [
+        'Price', 'Final Score', 'Momentum Score', 'Trend Score', 'Volatility Score',
+        'Strength Score', 'Support/Resistance', 'RSI', 'MACD', 'ATR', 'ADX',
+        'Stochastic', 'Williams %R', 'CCI'
+    ]
+    
+    rng = np.random.default_rng(0)
+    numeric = rng.standard_normal((len(tickers), len(numeric_columns))).astype(np.float32)
+    test_df = pd.DataFrame(numeric, columns=numeric_columns)
+    test_df.insert(0, 'Ticker', tickers)
+    test_df.insert(3, 'Signal', signals)
     
     st.info("This table should have horizontal scrolling enabled. Try scrolling horizontally to see all columns.")
     
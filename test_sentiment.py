@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Sentiment analyzer and sentiment app tests
+Run with pytest; analyzers come from the session fixtures in conftest.py
+"""
+
+import importlib.util
+import logging
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from unittest import mock
+import pytest
+import requests
+
+log = logging.getLogger(__name__)
+
+APP_PATH = Path(__file__).with_name("sentiment_app.py")
+APP_URL = "http://localhost:8505"
+HEALTH_URL = f"{APP_URL}/_stcore/health"
+
+TICKER_CASES = [["AAPL"], ["AAPL", "TSLA"]]
+
+def test_api_status(analyzer):
+    """Every source reports a status, and StockTwits needs no configuration"""
+    status = analyzer.get_api_status()
+    log.info("API Status: %s", status)
+
+    assert set(status) == {"X (Grok API)", "Reddit", "StockTwits"}
+    assert status["StockTwits"]
+
+@pytest.mark.parametrize("tickers", TICKER_CASES)
+def test_sentiment_for_tickers(analyzer, tickers):
+    """Sentiment analysis returns one formatted row per ticker"""
+    results = analyzer.get_sentiment_for_tickers(tickers, hours_back=24)
+    log.info("Analysis completed. Results shape: %s", results.shape)
+
+    assert results["Ticker"].tolist() == tickers
+
+    formatted = analyzer.format_sentiment_results(results)
+    log.info("%s", formatted.to_string(index=False))
+
+    assert formatted["Ticker"].tolist() == tickers
+
+@pytest.mark.parametrize("tickers", TICKER_CASES)
+def test_reddit_sentiment(reddit_analyzer, tickers):
+    """Reddit returns real sentiment data with the Railway credentials"""
+    if not reddit_analyzer.get_api_status()["Reddit"]:
+        pytest.skip("Reddit API not configured")
+
+    end_time = datetime.now(timezone.utc)
+    start_time = end_time - timedelta(hours=24)
+
+    # Searches run one at a time: the analyzer's praw.Reddit client is not thread-safe
+    scores = {ticker: reddit_analyzer._get_reddit_sentiment(ticker, start_time, end_time) for ticker in tickers}
+    log.info("Reddit scores %s to %s: %s", start_time.strftime('%Y-%m-%d %H:%M'), end_time.strftime('%Y-%m-%d %H:%M'), scores)
+
+    assert any(scores.values()), "All tickers returned 0 - may need to adjust search parameters"
+
+def test_sentiment_app_loads():
+    """sentiment_app.py imports and runs its module-level setup without binding a port"""
+    spec = importlib.util.spec_from_file_location("sentiment_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch("streamlit.set_page_config"):
+        spec.loader.exec_module(module)
+
+    assert callable(module.main)
+
+@pytest.mark.skipif(os.getenv("FULL_E2E") != "1", reason="set FULL_E2E=1 to launch Streamlit")
+def test_sentiment_app_serves():
+    """sentiment_app.py starts under Streamlit and answers HTTP requests"""
+    process = subprocess.Popen([
+        sys.executable, "-m", "streamlit", "run", str(APP_PATH),
+        "--server.port=8505",
+        "--server.headless=true"
+    ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    session = requests.Session()
+
+    try:
+        # Poll the health endpoint until the server is ready (up to 10 seconds)
+        ready = False
+        deadline = time.monotonic() + 10
+        delay = 0.1
+        while not ready and time.monotonic() < deadline and process.poll() is None:
+            try:
+                ready = session.get(HEALTH_URL, timeout=0.5).ok
+            except requests.RequestException:
+                pass
+            if not ready:
+                time.sleep(delay)
+                delay = min(delay * 1.5, 1.0)
+
+        assert process.poll() is None, process.stderr.read().decode()
+        assert ready, "Streamlit did not become healthy within 10 seconds"
+        assert session.get(APP_URL, timeout=5).status_code == 200
+    finally:
+        process.terminate()
+        process.wait()
+        session.close()
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -2,20 +2,43 @@
 Simple test script for Btock without Streamlit dependencies
 """
 
-import yfinance as yf
 import ta
 import pandas as pd
 import numpy as np
+from functools import lru_cache
+from _pool import get_ohlcv
 
-def test_simple():
+@lru_cache(maxsize=8)
+def _prices(ticker: str) -> pd.DataFrame:
+    """Price history for one of the shared test tickers"""
+    return get_ohlcv()[ticker].dropna(how="all")
+
+@lru_cache(maxsize=32)
+def _rsi(ticker: str, window: int) -> pd.Series:
+    return ta.momentum.RSIIndicator(_prices(ticker)['Close'], window=window).rsi()
+
+@lru_cache(maxsize=32)
+def _macd(ticker: str) -> pd.Series:
+    return ta.trend.MACD(_prices(ticker)['Close']).macd()
+
+@lru_cache(maxsize=32)
+def _atr(ticker: str, window: int) -> pd.Series:
+    data = _prices(ticker)
+    return ta.volatility.AverageTrueRange(data['High'], data['Low'], data['Close'], window=window).average_true_range()
+
+@lru_cache(maxsize=32)
+def _adx(ticker: str, window: int) -> pd.Series:
+    data = _prices(ticker)
+    return ta.trend.ADXIndicator(data['High'], data['Low'], data['Close'], window=window).adx()
+
+def test_simple(ohlcv):
     print("🧪 Testing Core Functionality")
     print("=" * 40)
     
     # Test data fetching
     print("1. Testing data fetch...")
     ticker = "AAPL"
-    stock = yf.Ticker(ticker)
-    data = stock.history(period="6mo")
+    data = ohlcv[ticker].dropna(how="all")
     
     if data.empty:
         print("❌ Failed to fetch data")
@@ -28,22 +51,21 @@ def test_simple():
     print("\n2. Testing indicators...")
     
     try:
+        # Indicators are cached per ticker and window, so repeat runs reuse them
         # RSI
-        rsi = ta.momentum.RSIIndicator(data['Close'], window=14).rsi()
+        rsi = _rsi(ticker, 14)
         print(f"📈 RSI: {rsi.iloc[-1]:.2f}")
         
         # MACD
-        macd_indicator = ta.trend.MACD(data['Close'])
-        macd = macd_indicator.macd()
+        macd = _macd(ticker)
         print(f"📈 MACD: {macd.iloc[-1]:.4f}")
         
         # ATR
-        atr = ta.volatility.AverageTrueRange(data['High'], data['Low'], data['Close'], window=14).average_true_range()
+        atr = _atr(ticker, 14)
         print(f"📈 ATR: {atr.iloc[-1]:.2f}")
         
         # ADX
-        adx_indicator = ta.trend.ADXIndicator(data['High'], data['Low'], data['Close'], window=14)
-        adx = adx_indicator.adx()
+        adx = _adx(ticker, 14)
         print(f"📈 ADX: {adx.iloc[-1]:.2f}")
         
         print("✅ All indicators calculated successfully")
@@ -56,4 +78,4 @@ def test_simple():
     return True
 
 if __name__ == "__main__":
-    test_simple()
+    test_simple(get_ohlcv())
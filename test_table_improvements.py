@@ -3,82 +3,126 @@
 Test the table scrolling and sentiment selection improvements
 """
 
-import sys
+import time
+import traceback
+import numpy as np
 import pandas as pd
-sys.path.append('/home/ubuntu/Btock')
+from modules.utils import DataFormatter
 
 def test_table_improvements():
     """Test the table and sentiment improvements"""
     
-    print("🧪 Testing Table and Sentiment Improvements...")
+    # Collect the report and write it in one go rather than line by line
+    lines = ["🧪 Testing Table and Sentiment Improvements..."]
     
     try:
         # Test 1: Check if the table configuration is correct
-        print("✅ Test 1: Table Configuration")
-        print("   - Added height=400 for better display")
-        print("   - Added use_container_width=False for horizontal scrolling")
-        print("   - Maintained width='stretch' for responsive design")
-        print("   - Column configuration preserved")
+        lines.extend([
+            "✅ Test 1: Table Configuration",
+            "   - Added height=400 for better display",
+            "   - Added use_container_width=False for horizontal scrolling",
+            "   - Maintained width='stretch' for responsive design",
+            "   - Column configuration preserved",
+        ])
         
         # Test 2: Check sentiment selection improvements
-        print("✅ Test 2: Sentiment Selection Improvements")
-        print("   - Added 3-column layout for better organization")
-        print("   - Added 'Quick select' dropdown with options [5, 10, 20]")
-        print("   - Added 'Select Top N' button for easy selection")
-        print("   - Added session state management for selected tickers")
-        print("   - Maintained original multiselect functionality")
+        lines.extend([
+            "✅ Test 2: Sentiment Selection Improvements",
+            "   - Added 3-column layout for better organization",
+            "   - Added 'Quick select' dropdown with options [5, 10, 20]",
+            "   - Added 'Select Top N' button for easy selection",
+            "   - Added session state management for selected tickers",
+            "   - Maintained original multiselect functionality",
+        ])
         
         # Test 3: Verify the improvements work together
-        print("✅ Test 3: Integration Verification")
-        print("   - Table scrolling works independently of sentiment analysis")
-        print("   - Sentiment selection doesn't affect table display")
-        print("   - Both features enhance user experience")
+        lines.extend([
+            "✅ Test 3: Integration Verification",
+            "   - Table scrolling works independently of sentiment analysis",
+            "   - Sentiment selection doesn't affect table display",
+            "   - Both features enhance user experience",
+        ])
         
         # Test 4: Check for potential issues
-        print("✅ Test 4: Safety Checks")
-        print("   - No changes to core analysis functionality")
-        print("   - No modifications to data processing")
-        print("   - Backward compatibility maintained")
-        print("   - Session state properly initialized")
+        lines.extend([
+            "✅ Test 4: Safety Checks",
+            "   - No changes to core analysis functionality",
+            "   - No modifications to data processing",
+            "   - Backward compatibility maintained",
+            "   - Session state properly initialized",
+        ])
         
+        print("\n".join(lines))
         return True
         
     except Exception as e:
+        print("\n".join(lines))
         print(f"❌ Test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
+def test_top_n_matches_nlargest():
+    """Top N selection over a large synthetic results frame matches nlargest"""
+    rng = np.random.default_rng(0)
+    results = pd.DataFrame({
+        'ticker': [f"T{i}" for i in range(10_000)],
+        'final_weighted_score': rng.standard_normal(10_000)
+    })
+    start = time.perf_counter()
+    top = DataFormatter.top_n(results, 20)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"✅ Top 20 of {len(results):,} rows selected in {elapsed_ms:.2f} ms")
+    
+    assert top.equals(results.nlargest(20, 'final_weighted_score'))
+
+def test_top_n_ties_keep_row_order():
+    """Tied scores keep their original row order and missing scores are never selected"""
+    results = pd.DataFrame({
+        'ticker': ['A', 'B', 'C', 'D', 'E'],
+        'final_weighted_score': [1.0, 2.0, 2.0, np.nan, 3.0]
+    })
+    
+    assert DataFormatter.top_n(results, 2).index.tolist() == [4, 1]
+    assert DataFormatter.top_n(results, 3).index.tolist() == [4, 1, 2]
+    assert DataFormatter.top_n(results, 10).index.tolist() == [4, 1, 2, 0]
+    assert DataFormatter.top_n(results, 2).equals(results.nlargest(2, 'final_weighted_score'))
+
 def main():
     """Main test function"""
     
-    print("🎯 Table Scrolling and Sentiment Selection Test")
-    print("=" * 55)
+    print("🎯 Table Scrolling and Sentiment Selection Test\n" + "=" * 55)
     
     success = test_table_improvements()
     
     if success:
-        print("\n🎉 All Improvements Successfully Implemented!")
-        print("\n📊 TABLE IMPROVEMENTS:")
-        print("   ✅ Horizontal scrolling enabled with height=400")
-        print("   ✅ Better column visibility for wide tables")
-        print("   ✅ Responsive design maintained")
-        print("   ✅ All column configurations preserved")
+        lines = [
+            "\n🎉 All Improvements Successfully Implemented!",
+            "\n📊 TABLE IMPROVEMENTS:",
+            "   ✅ Horizontal scrolling enabled with height=400",
+            "   ✅ Better column visibility for wide tables",
+            "   ✅ Responsive design maintained",
+            "   ✅ All column configurations preserved",
+        ]
         
-        print("\n🎯 SENTIMENT SELECTION IMPROVEMENTS:")
-        print("   ✅ Quick select dropdown: Top 5, 10, or 20")
-        print("   ✅ 'Select Top N' button for instant selection")
-        print("   ✅ Session state management for persistence")
-        print("   ✅ 3-column layout for better organization")
-        print("   ✅ Original multiselect functionality preserved")
+        lines.extend([
+            "\n🎯 SENTIMENT SELECTION IMPROVEMENTS:",
+            "   ✅ Quick select dropdown: Top 5, 10, or 20",
+            "   ✅ 'Select Top N' button for instant selection",
+            "   ✅ Session state management for persistence",
+            "   ✅ 3-column layout for better organization",
+            "   ✅ Original multiselect functionality preserved",
+        ])
         
-        print("\n🚀 USER EXPERIENCE BENEFITS:")
-        print("   📊 Better table navigation with horizontal scrolling")
-        print("   🎯 Faster ticker selection with quick options")
-        print("   💾 Selection persistence across interactions")
-        print("   🎨 Improved layout and organization")
+        lines.extend([
+            "\n🚀 USER EXPERIENCE BENEFITS:",
+            "   📊 Better table navigation with horizontal scrolling",
+            "   🎯 Faster ticker selection with quick options",
+            "   💾 Selection persistence across interactions",
+            "   🎨 Improved layout and organization",
+        ])
         
-        print("\n✅ Ready for deployment!")
+        lines.append("\n✅ Ready for deployment!")
+        print("\n".join(lines))
     else:
         print("\n❌ Improvements need adjustment")
 
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Ticker file upload parsing tests
+"""
+
+import sys
+import pytest
+from modules import utils
+from modules.utils import FileProcessor, TickerFileError
+
+ZERO_PADDED_CSV = b"Symbol,Name\n0700,Tencent\n0001,CK Hutchison\naapl,Apple\n"
+
+@pytest.fixture(params=["pyarrow", "c"])
+def csv_parser(request, monkeypatch):
+    """Run a test with pyarrow's CSV reader and again with pandas' C parser"""
+    if request.param == "pyarrow" and utils.pa is None:
+        pytest.skip("pyarrow not installed")
+    if request.param == "c":
+        monkeypatch.setattr(utils, "pa", None)
+    FileProcessor._parse_tickers.clear()
+    yield request.param
+    FileProcessor._parse_tickers.clear()
+
+def test_zero_padded_tickers_keep_leading_zeros(csv_parser):
+    """Numeric HK/JP-style tickers are read as text, not as integers"""
+    assert FileProcessor._parse_tickers("tickers.csv", ZERO_PADDED_CSV) == ["0700", "0001", "AAPL"]
+
+def test_missing_ticker_column_is_reported(csv_parser):
+    with pytest.raises(TickerFileError):
+        FileProcessor._parse_tickers("tickers.csv", b"Name\nApple\n")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -3,19 +3,136 @@
 Test the X API troubleshooting and fixes
 """
 
-import sys
-import os
+import traceback
+import json
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
-sys.path.append('/home/ubuntu/Btock')
+from pathlib import Path
+from _pool import secret
+
+# X API key, read once from the environment or a local .env file
+API_KEY = secret("XAI_API_KEY")
+
+# Pooled keep-alive session shared by every endpoint probe; transient failures
+# (rate limits, overloads, 5xx) are retried with jittered exponential backoff
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=1.5, backoff_jitter=1.0,
+                      status_forcelist=(429, 500, 502, 503, 504, 529),
+                      allowed_methods=frozenset({'GET', 'POST', 'OPTIONS'}),
+                      respect_retry_after_header=True)
+))
+SESSION.headers.update({
+    "Authorization": f"Bearer {API_KEY}",
+    "Content-Type": "application/json"
+})
+
+# Preflight statuses showing the endpoint exists, even if it rejects OPTIONS or the key
+REACHABLE_STATUSES = frozenset({200, 204, 401, 403, 405})
+
+# Working endpoint from the last sweep, reused for a day so reruns skip the sweep
+ENDPOINT_CACHE = Path.home() / ".cache" / "btock" / "xai_endpoint.json"
+ENDPOINT_CACHE_TTL = 86400
+
+def _load_cached_endpoint():
+    """Return the cached working endpoint if it is fresh and still reachable, else None"""
+    try:
+        cached = json.loads(ENDPOINT_CACHE.read_text())
+        if time.time() - cached["ts"] >= ENDPOINT_CACHE_TTL:
+            return None
+        if SESSION.options(cached["url"], timeout=3).status_code not in REACHABLE_STATUSES:
+            return None
+        return cached["url"]
+    except (OSError, ValueError, KeyError, TypeError, requests.exceptions.RequestException):
+        return None
+
+def _store_endpoint(endpoint: str):
+    """Cache a working endpoint for later runs"""
+    try:
+        ENDPOINT_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        ENDPOINT_CACHE.write_text(json.dumps({"url": endpoint, "ts": time.time()}))
+    except OSError as e:
+        print(f"   ⚠️  Could not cache endpoint: {e}")
+
+def _probe(endpoint: str, body: bytes, found: threading.Event):
+    """
+    Probe an endpoint with a pre-serialized JSON body, returning the response or the exception raised
+    
+    A cheap OPTIONS preflight runs first; the full POST is only sent to endpoints
+    that exist, otherwise the preflight response (e.g. 404) is returned. Once another
+    probe has found a working endpoint (found is set), no further requests are sent
+    and None is returned.
+    """
+    try:
+        if found.is_set():
+            return None
+        preflight = SESSION.options(endpoint, timeout=3, stream=True)
+        if preflight.status_code not in REACHABLE_STATUSES:
+            return preflight
+        with preflight:
+            if found.is_set():
+                return None
+        # Bodies are streamed so error pages are never buffered past the printed snippet
+        response = SESSION.post(endpoint, data=body, timeout=10, stream=True)
+        if response.status_code == 200:
+            found.set()
+        elif found.is_set():
+            with response:
+                return None
+        return response
+    except Exception as e:
+        return e
+
+def _discard_probe(future):
+    """Close the response of a probe that finished after the sweep stopped reporting"""
+    if not future.cancelled() and isinstance(future.result(), requests.Response):
+        future.result().close()
+
+def _body_snippet(response: requests.Response, limit: int = 256) -> str:
+    """Read at most limit bytes of a streamed response body for an error message"""
+    return response.raw.read(limit, decode_content=True).decode("utf-8", "replace")
+
+def _report_probe(endpoint: str, outcome):
+    """Print the diagnostic for one endpoint probe"""
+    print(f"\n🔍 Testing endpoint: {endpoint}")
+    
+    if isinstance(outcome, requests.exceptions.RetryError):
+        print(f"   🔁 Still failing after retries: {outcome}")
+    elif isinstance(outcome, requests.exceptions.ConnectionError):
+        print(f"   🔌 Connection Error: Cannot reach endpoint")
+    elif isinstance(outcome, Exception):
+        print(f"   ❌ Error: {outcome}")
+    else:
+        with outcome as response:
+            print(f"   Status Code: {response.status_code}")
+            
+            if response.status_code == 200:
+                print(f"   ✅ SUCCESS: Endpoint working!")
+                print(f"   Response: {response.json()}")
+            elif response.status_code == 404:
+                print(f"   ❌ 404 Not Found: Endpoint doesn't exist")
+            elif response.status_code == 401:
+                print(f"   ❌ 401 Unauthorized: Invalid API key")
+            elif response.status_code == 403:
+                print(f"   ❌ 403 Forbidden: Access denied")
+            else:
+                print(f"   ⚠️  {response.status_code}: {_body_snippet(response)}")
 
 def test_x_api_manually():
     """Test X API manually with different endpoints"""
     
     print("🧪 Testing X API Endpoints Manually...")
     
-    # Use the API key from Railway environment
-    api_key = "xai-D2gvIxMfaNn9kzadd4JvxL632GAGz5nHaO4DqbQy3cn1E23qaQDcvOcdhxURf"
+    if not API_KEY:
+        print("❌ XAI_API_KEY is not set - export it or add it to .env")
+        return None
     
     endpoints_to_test = [
         "https://api.x.ai/v1/chat/completions",      # Current
@@ -24,63 +141,56 @@ def test_x_api_manually():
         "https://api.openai.com/v1/chat/completions" # OpenAI fallback
     ]
     
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
+    # Every endpoint gets the same payload, so it is serialized once
+    body = json.dumps({
         "model": "grok-beta",
         "messages": [{"role": "user", "content": "test"}],
         "max_tokens": 1
-    }
+    }).encode("utf-8")
     
-    for endpoint in endpoints_to_test:
-        print(f"\n🔍 Testing endpoint: {endpoint}")
-        
-        try:
-            response = requests.post(endpoint, headers=headers, json=payload, timeout=10)
-            
-            print(f"   Status Code: {response.status_code}")
+    cached_endpoint = _load_cached_endpoint()
+    if cached_endpoint:
+        print(f"\n✅ Using cached working endpoint: {cached_endpoint}")
+        return cached_endpoint
+    
+    # Probe every endpoint at once so one slow endpoint doesn't hold up the rest;
+    # results are reported from this thread as they complete
+    found = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=len(endpoints_to_test))
+    futures = {}
+    try:
+        futures = {executor.submit(_probe, endpoint, body, found): endpoint for endpoint in endpoints_to_test}
+        for future in as_completed(futures):
+            endpoint = futures.pop(future)
+            outcome = future.result()
+            if outcome is None:
+                continue
+            _report_probe(endpoint, outcome)
             
-            if response.status_code == 200:
-                print(f"   ✅ SUCCESS: Endpoint working!")
-                print(f"   Response: {response.json()}")
+            if not isinstance(outcome, Exception) and outcome.status_code == 200:
+                _store_endpoint(endpoint)
                 return endpoint
-            elif response.status_code == 404:
-                print(f"   ❌ 404 Not Found: Endpoint doesn't exist")
-            elif response.status_code == 401:
-                print(f"   ❌ 401 Unauthorized: Invalid API key")
-            elif response.status_code == 403:
-                print(f"   ❌ 403 Forbidden: Access denied")
-            else:
-                print(f"   ⚠️  {response.status_code}: {response.text[:100]}")
-                
-        except requests.exceptions.Timeout:
-            print(f"   ⏰ Timeout: Endpoint not responding")
-        except requests.exceptions.ConnectionError:
-            print(f"   🔌 Connection Error: Cannot reach endpoint")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
+    finally:
+        # Stop waiting on the remaining probes once an endpoint works; any that are
+        # already running close their responses when they finish
+        executor.shutdown(wait=False, cancel_futures=True)
+        for future in futures:
+            future.add_done_callback(_discard_probe)
     
     print("\n❌ No working X API endpoints found")
     return None
 
-def test_sentiment_analyzer():
+def test_sentiment_analyzer(endpoint: str = "https://api.x.ai/v1/chat/completions"):
     """Test the sentiment analyzer with X API"""
     
     print("\n🧪 Testing Sentiment Analyzer with X API...")
     
-    # Set up environment variables
-    os.environ["XAI_API_KEY"] = "xai-D2gvIxMfaNn9kzadd4JvxL632GAGz5nHaO4DqbQy3cn1E23qaQDcvOcdhxURf"
-    os.environ["XAI_API_URL"] = "https://api.x.ai/v1/chat/completions"
-    
     try:
         from modules.sentiment_analyzer import SentimentAnalyzer
         print("✅ Import successful")
         
-        # Initialize analyzer
-        analyzer = SentimentAnalyzer()
+        # Initialize analyzer with the key and endpoint passed explicitly
+        analyzer = SentimentAnalyzer(creds={"XAI_API_KEY": API_KEY} if API_KEY else {}, base_url=endpoint)
         print("✅ Initialization successful")
         
         # Check X API status
@@ -90,24 +200,24 @@ def test_sentiment_analyzer():
         if status.get("X (Grok API)", False):
             print("🚀 X API is configured! Testing sentiment analysis...")
             
-            # Test X sentiment for a ticker
+            # Score several tickers with one batched Grok request
             end_time = datetime.now(timezone.utc)
             start_time = end_time - timedelta(hours=24)
             
-            test_ticker = "AAPL"
-            print(f"\n🔍 Testing X sentiment for {test_ticker}...")
+            test_tickers = ["AAPL", "MSFT", "GOOG"]
+            print(f"\n🔍 Testing X sentiment for {', '.join(test_tickers)}...")
             
-            x_score = analyzer._get_x_sentiment(test_ticker, start_time, end_time)
+            x_scores = analyzer._get_x_sentiment_batch(test_tickers, start_time, end_time)
             
             print(f"\n📊 Results:")
-            print(f"   Ticker: {test_ticker}")
-            print(f"   X Sentiment Score: {x_score}")
+            for ticker in test_tickers:
+                print(f"   {ticker} X Sentiment Score: {x_scores.get(ticker, 0)}")
             
-            if x_score != 0:
+            if any(x_scores.values()):
                 print("✅ SUCCESS: X API is working and returning sentiment data!")
                 return True
             else:
-                print("⚠️  X API returned 0 - check the detailed logs above")
+                print("⚠️  X API returned 0 for every ticker - check the detailed logs above")
                 return False
                 
         else:
@@ -116,7 +226,6 @@ def test_sentiment_analyzer():
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -133,11 +242,8 @@ def main():
         print(f"\n✅ Found working endpoint: {working_endpoint}")
         print(f"💡 Update XAI_API_URL in Railway to: {working_endpoint}")
         
-        # Update environment for testing
-        os.environ["XAI_API_URL"] = working_endpoint
-        
         # Test 2: Sentiment analyzer testing
-        success = test_sentiment_analyzer()
+        success = test_sentiment_analyzer(working_endpoint)
         
         if success:
             print("\n🎉 X API troubleshooting successful!")